@@ -98,6 +98,10 @@ hiddenimports = [
     'sync.supabase_client',
     'sync.auth_server',
 
+    # Lazily imported by core.engine (kept out of the launch path)
+    'camera.capture',
+    'reporting.pdf_report',
+
     # OpenAI and HTTP clients
     'openai',
     'openai.resources',
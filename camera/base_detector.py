@@ -5,6 +5,7 @@ import logging
 import time
 import threading
 from typing import Protocol, Dict, Any, Optional, Tuple
+import cv2
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,30 @@ DEFAULT_SAFE_RESULT: Dict[str, Any] = {
 }
 
 
+# Resolution frames are downscaled to before being sent to a vision API
+API_FRAME_SIZE: Tuple[int, int] = (640, 480)
+
+
+def resize_for_api(frame: np.ndarray) -> np.ndarray:
+    """
+    Downscale a camera frame to API_FRAME_SIZE to reduce token usage.
+    
+    Returns the frame unchanged when it is already at the target size
+    (e.g. cameras that fell back to standard 640x480), skipping a
+    full-frame copy.
+    
+    Args:
+        frame: BGR image from camera
+        
+    Returns:
+        Frame at API_FRAME_SIZE.
+    """
+    width, height = API_FRAME_SIZE
+    if frame.shape[1] == width and frame.shape[0] == height:
+        return frame
+    return cv2.resize(frame, API_FRAME_SIZE)
+
+
 def get_safe_default_result() -> Dict[str, Any]:
     """
     Get a safe default detection result for error/timeout scenarios.
@@ -578,6 +578,44 @@ class CameraCapture:
             logger.error(f"Error reading frame: {e}")
             return False, None
     
+    def read_latest_frame(self, skip: int = 4) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read the most recent frame, discarding frames buffered since the last read.
+
+        Grabs (without decoding) up to `skip` buffered frames, then decodes
+        only the newest one. Use this when frames are consumed far slower
+        than the camera produces them.
+
+        Args:
+            skip: Number of buffered frames to drop before decoding.
+
+        Returns:
+            Tuple of (success: bool, frame: numpy array or None)
+        """
+        if not self.is_opened or self.cap is None:
+            logger.warning("Attempted to read from closed camera")
+            return False, None
+
+        try:
+            for _ in range(skip):
+                if not self.cap.grab():
+                    break
+            ret, frame = self.cap.retrieve()
+
+            if not ret:
+                # Nothing grabbed to retrieve (e.g. skip=0) - fall back to a full read
+                ret, frame = self.cap.read()
+
+            if not ret:
+                logger.warning("Failed to read frame from camera")
+                return False, None
+
+            return True, frame
+
+        except Exception as e:
+            logger.error(f"Error reading frame: {e}")
+            return False, None
+
     def frame_iterator(self) -> Iterator[np.ndarray]:
         """
         Create an iterator that yields frames continuously.
@@ -14,7 +14,8 @@ from camera.base_detector import (
     get_safe_default_result,
     parse_detection_response,
     DetectionCache,
-    retry_with_backoff
+    retry_with_backoff,
+    resize_for_api
 )
 
 logger = logging.getLogger(__name__)
@@ -96,7 +97,7 @@ class GeminiVisionDetector:
             PIL Image object
         """
         # Resize to reduce token usage (smaller = cheaper)
-        resized = cv2.resize(frame, (640, 480))
+        resized = resize_for_api(frame)
         
         # Convert BGR to RGB
         rgb_frame = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
@@ -342,7 +343,7 @@ PHONE/TABLET ON TABLE = Only if actively viewing:
                 return get_safe_default_result()
             
             # Debug log the response
-            logger.debug(f"Gemini API raw response: {content[:200] if content else 'EMPTY'}")
+            logger.debug("Gemini API raw response: %s", content[:200] if content else "EMPTY")
             
             if not content or content.strip() == "":
                 logger.error("Empty response from Gemini API")
@@ -15,7 +15,8 @@ from camera.base_detector import (
     get_safe_default_result,
     parse_detection_response,
     DetectionCache,
-    retry_with_backoff
+    retry_with_backoff,
+    resize_for_api
 )
 
 logger = logging.getLogger(__name__)
@@ -84,7 +85,7 @@ class VisionDetector:
             Base64 encoded JPEG string
         """
         # Resize to reduce token usage (smaller = cheaper)
-        resized = cv2.resize(frame, (640, 480))
+        resized = resize_for_api(frame)
         
         # Encode as JPEG
         _, buffer = cv2.imencode('.jpg', resized, [cv2.IMWRITE_JPEG_QUALITY, 80])
@@ -332,7 +333,7 @@ PHONE/TABLET ON TABLE = Only if actively viewing:
             content = response.choices[0].message.content
             
             # Debug log the response
-            logger.debug(f"Vision API raw response: {content[:200] if content else 'EMPTY'}")
+            logger.debug("Vision API raw response: %s", content[:200] if content else "EMPTY")
             
             if not content or content.strip() == "":
                 logger.error("Empty response from Vision API")
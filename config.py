@@ -287,6 +287,8 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Credits / usage (cloud-synced; local cache in usage_data.json)
 USAGE_DATA_FILE = USER_DATA_DIR / "usage_data.json"  # Local cache of credit balance
 CREDITS_SYNC_INTERVAL = 300  # Seconds between optional background sync (session start/end are primary)
+CREDITS_SYNC_COALESCE_SECONDS = 5  # Reuse a sync this recent instead of hitting the cloud again
+CREDITS_REFRESH_INTERVAL = 30  # Seconds between menu/tray credit refreshes while the app is open
 
 # Deprecated: replaced by credit packs (Supabase user_credits)
 MVP_LIMIT_SECONDS = 7200
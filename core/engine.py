@@ -16,24 +16,27 @@ Callbacks:
     on_alert(level: int, message: str)
 """
 
+import os
 import sys
 import json
 import time
+import tempfile
 import threading
 import subprocess
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Callable
+from typing import TYPE_CHECKING, Dict, Optional, Callable
 
 import config
-from camera.capture import CameraCapture, CameraFailureType
+# camera.capture (OpenCV) and reporting.pdf_report (ReportLab) are imported
+# lazily where used so the menu bar appears without loading them at launch
 from camera import get_event_type, create_vision_detector
 from tracking.session import Session
 from tracking.analytics import compute_statistics
 from tracking.usage_limiter import get_usage_limiter, UsageLimiter
 from tracking.daily_stats import get_daily_stats_tracker, DailyStatsTracker
-from reporting.pdf_report import generate_report
 from screen.window_detector import WindowDetector, get_screen_state, get_screen_state_with_ai_fallback
 from screen.blocklist import Blocklist, BlocklistManager
 
@@ -43,11 +46,22 @@ from core.permissions import (
     check_windows_screen_permission,
 )
 
+if TYPE_CHECKING:
+    from camera.capture import CameraFailureType
+
 logger = logging.getLogger(__name__)
 
 # Path to persist the last generated report path across app restarts
 _LAST_REPORT_FILE = config.USER_DATA_DIR / "last_report.json"
 
+# Detection event type -> (status, display text) for on_status_change
+_EVENT_TO_STATUS = {
+    config.EVENT_PRESENT: ("focused", "Focussed"),
+    config.EVENT_AWAY: ("away", "Away from Desk"),
+    config.EVENT_GADGET_SUSPECTED: ("gadget", "On another gadget"),
+    config.EVENT_SCREEN_DISTRACTION: ("screen", "Screen distraction"),
+}
+
 
 class SessionEngine:
     """
@@ -67,6 +81,13 @@ class SessionEngine:
     get_status() on its own schedule (rumps @timer or pystray thread).
     """
 
+    # Event types that count towards unfocused time / escalating alerts
+    _UNFOCUSED_EVENTS = frozenset({
+        config.EVENT_AWAY,
+        config.EVENT_GADGET_SUSPECTED,
+        config.EVENT_SCREEN_DISTRACTION,
+    })
+
     # ------------------------------------------------------------------
     # Initialisation
     # ------------------------------------------------------------------
@@ -79,8 +100,14 @@ class SessionEngine:
         self.should_stop: threading.Event = threading.Event()
         self.detection_thread: Optional[threading.Thread] = None
         self.screen_detection_thread: Optional[threading.Thread] = None
+        self._report_thread: Optional[threading.Thread] = None
+        # Single reusable worker for alert sounds (created on first alert)
+        self._sound_executor: Optional[ThreadPoolExecutor] = None
         self.current_status: str = "idle"
+        self._current_status_text: str = "Ready to Start"
         self.session_start_time: Optional[datetime] = None
+        # Monotonic twin of session_start_time for elapsed-time polling (immune to clock steps)
+        self._session_start_monotonic: Optional[float] = None
         self.session_started: bool = False
 
         # Monitoring mode
@@ -92,6 +119,9 @@ class SessionEngine:
         # Pause state
         self.is_paused: bool = False
         self.pause_start_time: Optional[datetime] = None
+        # Monotonic twin of pause_start_time so paused time is measured on the
+        # same clock as _session_elapsed_seconds()
+        self._pause_start_monotonic: Optional[float] = None
         self.total_paused_seconds: float = 0.0
         self.frozen_active_seconds: int = 0
 
@@ -176,8 +206,10 @@ class SessionEngine:
         if self.is_running:
             return {"success": False, "error": "Session already running", "error_type": "already_running"}
 
-        # Sync credits from cloud so we have latest balance (e.g. after buying hours on website)
-        self.usage_limiter.sync_with_cloud()
+        # Sync credits from cloud so we have latest balance (e.g. after buying hours on website).
+        # The menu bar apps apply cloud settings (which sync too) right before this call,
+        # so reuse a sync from the last few seconds rather than round-tripping twice.
+        self.usage_limiter.sync_with_cloud(max_age=config.CREDITS_SYNC_COALESCE_SECONDS)
 
         # Clear locked state if credits are now available (user bought more hours)
         if self.is_locked and not self.usage_limiter.is_time_exhausted():
@@ -255,12 +287,14 @@ class SessionEngine:
         self.session = Session()
         self.session_started = False
         self.session_start_time = None
+        self._session_start_monotonic = None
         self.is_running = True
         self.should_stop.clear()
 
         # Reset pause state
         self.is_paused = False
         self.pause_start_time = None
+        self._pause_start_monotonic = None
         self.total_paused_seconds = 0.0
         self.frozen_active_seconds = 0
 
@@ -272,10 +306,10 @@ class SessionEngine:
         self.gadget_detection_count = 0
         self.screen_distraction_count = 0
 
-        # Reset shared detection state
-        with self._state_lock:
-            self._camera_state = None
-            self._screen_state = None
+        # Reset shared detection state. No lock: this session's detection threads
+        # are only spawned below, and each reset is a single atomic assignment.
+        self._camera_state = None
+        self._screen_state = None
 
         # Reset temporal filtering
         self._consecutive_borderline_count = 0
@@ -306,20 +340,22 @@ class SessionEngine:
         """
         Stop the current session and generate report.
 
+        The PDF report is built on a background thread so the calling (UI)
+        thread isn't blocked; its path is delivered via on_session_ended.
+
         Returns:
-            {"success": bool, "report_path": Optional[Path], "session_data": Optional[dict]}
+            {"success": bool, "report_path": None, "session_data": Optional[dict]}
+            report_path is kept for compatibility and is always None.
         """
         if not self.is_running:
             return {"success": False, "report_path": None, "session_data": None}
 
         stop_time = datetime.now()
+        stop_elapsed = self._session_elapsed_seconds() if self.session_start_time else 0.0
 
         # Finalise pause duration if paused
-        if self.is_paused and self.pause_start_time:
-            pause_duration = (stop_time - self.pause_start_time).total_seconds()
-            self.total_paused_seconds += pause_duration
-            self.is_paused = False
-            self.pause_start_time = None
+        if self.is_paused:
+            self._end_pause()
 
         # Signal threads to stop
         self.should_stop.set()
@@ -331,25 +367,22 @@ class SessionEngine:
         # End session and record usage
         session_data = None
         if self.session and self.session_started and self.session_start_time:
-            total_elapsed = (stop_time - self.session_start_time).total_seconds()
-            active_duration = max(1, int(total_elapsed - self.total_paused_seconds))
+            # Charge the same active time the live timer showed
+            active_duration = max(1, int(stop_elapsed - self.total_paused_seconds))
+            # Single wall-clock sample for consistency across session.end + usage_limiter.end_session
             self.usage_limiter.record_usage(active_duration)
             self.session.end(stop_time)
-            self.usage_limiter.end_session()
+            self.usage_limiter.end_session(stop_time)
 
             # Prepare session data for cloud upload
             session_data = self._build_session_data(active_duration)
 
-        # Generate report
-        report_path = self._generate_report()
-
-        # Notify UI
+        # Notify UI, then generate the report off the caller's thread
         self._notify_status_change("idle", "Ready to Start")
-        if self.on_session_ended:
-            self.on_session_ended(report_path)
+        self._start_report_worker()
 
         logger.info("Session stopped")
-        return {"success": True, "report_path": report_path, "session_data": session_data}
+        return {"success": True, "report_path": None, "session_data": session_data}
 
     def pause_session(self) -> None:
         """
@@ -362,10 +395,11 @@ class SessionEngine:
 
         self.is_paused = True
         self.pause_start_time = datetime.now()
+        self._pause_start_monotonic = time.monotonic()
 
         # Freeze active seconds at exact moment (int truncation = floor)
         if self.session_start_time:
-            elapsed = (self.pause_start_time - self.session_start_time).total_seconds()
+            elapsed = self._session_elapsed_seconds()
             self.frozen_active_seconds = int(elapsed - self.total_paused_seconds)
 
         # Log pause event
@@ -384,13 +418,7 @@ class SessionEngine:
         if not self.is_running or not self.is_paused:
             return
 
-        resume_time = datetime.now()
-
-        if self.pause_start_time:
-            self.total_paused_seconds += (resume_time - self.pause_start_time).total_seconds()
-
-        self.is_paused = False
-        self.pause_start_time = None
+        self._end_pause()
         self.frozen_active_seconds = 0
 
         if self.session and self.session_started:
@@ -412,8 +440,7 @@ class SessionEngine:
             if self.is_paused:
                 elapsed = self.frozen_active_seconds
             else:
-                total = (datetime.now() - self.session_start_time).total_seconds()
-                elapsed = int(total - self.total_paused_seconds)
+                elapsed = int(self._session_elapsed_seconds() - self.total_paused_seconds)
 
         return {
             "is_running": self.is_running,
@@ -424,6 +451,38 @@ class SessionEngine:
             "is_locked": self.is_locked,
         }
 
+    def _end_pause(self) -> None:
+        """
+        Add the current pause to total_paused_seconds and clear pause state.
+
+        Measured on the monotonic clock when available so it can be
+        subtracted from _session_elapsed_seconds() without a sleep or clock
+        change in between skewing the difference.
+        """
+        if self._pause_start_monotonic is not None:
+            self.total_paused_seconds += time.monotonic() - self._pause_start_monotonic
+        elif self.pause_start_time:
+            self.total_paused_seconds += (datetime.now() - self.pause_start_time).total_seconds()
+
+        self.is_paused = False
+        self.pause_start_time = None
+        self._pause_start_monotonic = None
+
+    def _session_elapsed_seconds(self) -> float:
+        """
+        Seconds since the session timer started, including paused time.
+
+        Uses time.monotonic() so the once-a-second status polling neither
+        builds datetime/timedelta objects nor jumps on system clock changes.
+        Falls back to wall-clock time if only session_start_time is set.
+
+        Returns:
+            Elapsed seconds as a float.
+        """
+        if self._session_start_monotonic is not None:
+            return time.monotonic() - self._session_start_monotonic
+        return (datetime.now() - self.session_start_time).total_seconds()
+
     def check_time_remaining(self) -> Dict:
         """
         Check usage time remaining.
@@ -435,9 +494,7 @@ class SessionEngine:
 
         # Subtract current session active time
         if self.is_running and self.session_start_time and not self.is_paused:
-            total = (datetime.now() - self.session_start_time).total_seconds()
-            active = int(total - self.total_paused_seconds)
-            remaining -= active
+            remaining -= int(self._session_elapsed_seconds() - self.total_paused_seconds)
 
         return {
             "remaining_seconds": max(0, remaining),
@@ -455,11 +512,12 @@ class SessionEngine:
             Path to the PDF, or None if no report exists or file was deleted.
         """
         try:
-            if _LAST_REPORT_FILE.exists():
-                data = json.loads(_LAST_REPORT_FILE.read_text())
-                path = Path(data.get("path", ""))
-                if path.exists():
-                    return path
+            data = json.loads(_LAST_REPORT_FILE.read_text())
+            path = Path(data.get("path", ""))
+            if path.is_file():
+                return path
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.debug(f"Could not read last report path: {e}")
         return None
@@ -496,6 +554,16 @@ class SessionEngine:
         """Clean up resources. Call before app quit."""
         if self.is_running:
             self.stop_session()
+
+        # Let an in-flight report finish so quitting doesn't lose it
+        if self._report_thread and self._report_thread.is_alive():
+            self._report_thread.join(timeout=30.0)
+            if self._report_thread.is_alive():
+                logger.warning("Report generation did not finish before cleanup timeout")
+
+        if self._sound_executor is not None:
+            self._sound_executor.shutdown(wait=False)
+            self._sound_executor = None
         logger.info("Engine cleanup complete")
 
     # ------------------------------------------------------------------
@@ -510,6 +578,8 @@ class SessionEngine:
         filtering, alert tracking, and priority resolution.
         """
         try:
+            from camera.capture import CameraCapture
+
             detector = create_vision_detector(enabled_gadgets=self.blocklist.enabled_gadgets)
 
             with CameraCapture() as camera:
@@ -518,14 +588,15 @@ class SessionEngine:
                     return
 
                 last_detection_time = time.time()
+                detection_interval = 1.0 / config.DETECTION_FPS
 
-                for frame in camera.frame_iterator():
-                    if self.should_stop.is_set():
-                        break
-
-                    # Skip detection when paused
+                # Frames are pulled on demand (not iterated) so only the frame that is
+                # actually analysed gets decoded; stale buffered frames are grabbed and dropped
+                while not self.should_stop.is_set():
+                    # Skip detection when paused (wait() wakes immediately on stop)
                     if self.is_paused:
-                        time.sleep(0.1)
+                        if self.should_stop.wait(0.1):
+                            break
                         continue
 
                     current_time = time.time()
@@ -534,7 +605,12 @@ class SessionEngine:
                     # Check for time exhaustion
                     self._check_time_exhaustion()
 
-                    if time_since_detection >= (1.0 / config.DETECTION_FPS):
+                    if time_since_detection >= detection_interval:
+                        success, frame = camera.read_latest_frame()
+                        if not success or frame is None:
+                            logger.warning("Failed to get frame, stopping detection loop")
+                            break
+
                         detection_state = detector.get_detection_state(frame)
 
                         # Re-check stop/pause after API call (takes 2-3 seconds)
@@ -547,6 +623,7 @@ class SessionEngine:
                         if not self.session_started:
                             self.session.start()
                             self.session_start_time = self.session.start_time
+                            self._session_start_monotonic = time.monotonic()
                             self.session_started = True
                             logger.info("First detection complete — session timer started")
 
@@ -582,7 +659,12 @@ class SessionEngine:
 
                         last_detection_time = current_time
 
-                    time.sleep(0.05)
+                    # Sleep until the next detection is due instead of polling
+                    # the clock every frame; stop_session() wakes us via should_stop.
+                    # Capped at 1s so time exhaustion is still checked every second.
+                    remaining = last_detection_time + detection_interval - time.time()
+                    if remaining > 0 and self.should_stop.wait(min(remaining, 1.0)):
+                        break
 
         except (KeyboardInterrupt, SystemExit):
             logger.info("Detection loop interrupted by shutdown signal")
@@ -617,13 +699,15 @@ class SessionEngine:
             if self.monitoring_mode == config.MODE_SCREEN_ONLY and not self.session_started:
                 self.session.start()
                 self.session_start_time = self.session.start_time
+                self._session_start_monotonic = time.monotonic()
                 self.session_started = True
                 logger.info("Screen-only mode — session timer started")
                 self._notify_status_change("focused", "Focussed")
 
             while not self.should_stop.is_set():
                 if self.is_paused:
-                    time.sleep(0.1)
+                    if self.should_stop.wait(0.1):
+                        break
                     continue
 
                 current_time = time.time()
@@ -686,7 +770,11 @@ class SessionEngine:
                     # Check for time exhaustion (screen-only sessions burn credits too)
                     self._check_time_exhaustion()
 
-                time.sleep(0.1)
+                # Sleep until the next screen check is due; stop_session() wakes
+                # us via should_stop instead of waiting out a polling sleep.
+                remaining = last_screen_check + config.SCREEN_CHECK_INTERVAL - time.time()
+                if remaining > 0 and self.should_stop.wait(min(remaining, 1.0)):
+                    break
 
         except (KeyboardInterrupt, SystemExit):
             logger.info("Screen detection loop interrupted by shutdown signal")
@@ -709,24 +797,26 @@ class SessionEngine:
         Returns:
             Event type constant.
         """
+        if self.is_paused:
+            return config.EVENT_PAUSED
+
+        # Both states are replaced wholesale (never mutated in place), so the
+        # lock only needs to cover taking a consistent pair of references
         with self._state_lock:
-            if self.is_paused:
-                return config.EVENT_PAUSED
+            camera_state = self._camera_state
+            screen_state = self._screen_state
 
-            if self._camera_state:
-                camera_event = get_event_type(self._camera_state)
-                if camera_event == config.EVENT_AWAY:
-                    return config.EVENT_AWAY
+        camera_event = get_event_type(camera_state) if camera_state else None
+        if camera_event == config.EVENT_AWAY:
+            return config.EVENT_AWAY
 
-            if self._screen_state and self._screen_state.get("is_distracted"):
-                return config.EVENT_SCREEN_DISTRACTION
+        if screen_state and screen_state.get("is_distracted"):
+            return config.EVENT_SCREEN_DISTRACTION
 
-            if self._camera_state:
-                camera_event = get_event_type(self._camera_state)
-                if camera_event == config.EVENT_GADGET_SUSPECTED:
-                    return config.EVENT_GADGET_SUSPECTED
+        if camera_event == config.EVENT_GADGET_SUSPECTED:
+            return config.EVENT_GADGET_SUSPECTED
 
-            return config.EVENT_PRESENT
+        return config.EVENT_PRESENT
 
     def _update_detection_status(self, event_type: str) -> None:
         """
@@ -735,13 +825,11 @@ class SessionEngine:
         Args:
             event_type: Detection event type constant.
         """
-        status_map = {
-            config.EVENT_PRESENT: ("focused", "Focussed"),
-            config.EVENT_AWAY: ("away", "Away from Desk"),
-            config.EVENT_GADGET_SUSPECTED: ("gadget", "On another gadget"),
-            config.EVENT_SCREEN_DISTRACTION: ("screen", "Screen distraction"),
-        }
-        status, text = status_map.get(event_type, ("idle", "Unknown"))
+        status, text = _EVENT_TO_STATUS.get(event_type, ("idle", "Unknown"))
+
+        # Detection usually repeats the previous result; skip redundant UI updates
+        if status == self.current_status and text == self._current_status_text:
+            return
         self._notify_status_change(status, text)
 
     @staticmethod
@@ -794,20 +882,21 @@ class SessionEngine:
             if gadget_confidence > 0.75:
                 self._consecutive_borderline_count = 0
                 self._last_gadget_confidence = gadget_confidence
-                logger.debug(f"High confidence gadget detection: {gadget_confidence:.2f}")
+                logger.debug("High confidence gadget detection: %.2f", gadget_confidence)
             else:
                 self._consecutive_borderline_count += 1
                 self._last_gadget_confidence = gadget_confidence
                 if self._consecutive_borderline_count >= 2:
                     logger.debug(
-                        f"Borderline gadget confirmed after {self._consecutive_borderline_count} consecutive detections"
+                        "Borderline gadget confirmed after %d consecutive detections",
+                        self._consecutive_borderline_count,
                     )
                 else:
                     detection_state = dict(detection_state)
                     detection_state["gadget_suspected"] = False
                     logger.debug(
-                        f"Borderline gadget ({gadget_confidence:.2f}) — waiting "
-                        f"({self._consecutive_borderline_count}/2)"
+                        "Borderline gadget (%.2f) — waiting (%d/2)",
+                        gadget_confidence, self._consecutive_borderline_count,
                     )
         else:
             if self._consecutive_borderline_count > 0:
@@ -829,13 +918,7 @@ class SessionEngine:
             event_type: Current resolved event type.
             current_time: time.time() timestamp.
         """
-        is_unfocused = event_type in (
-            config.EVENT_AWAY,
-            config.EVENT_GADGET_SUSPECTED,
-            config.EVENT_SCREEN_DISTRACTION,
-        )
-
-        if is_unfocused:
+        if event_type in self._UNFOCUSED_EVENTS:
             if self.unfocused_start_time is None:
                 self.unfocused_start_time = current_time
                 self.alerts_played = 0
@@ -909,7 +992,11 @@ class SessionEngine:
             except Exception as e:
                 logger.warning(f"Sound playback error: {e}")
 
-        threading.Thread(target=_play_sound, daemon=True).start()
+        if self._sound_executor is None:
+            self._sound_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="braindock-alert"
+            )
+        self._sound_executor.submit(_play_sound)
 
         # Notify UI via callback
         if self.on_alert:
@@ -933,8 +1020,7 @@ class SessionEngine:
             return
 
         base_remaining = self.usage_limiter.get_remaining_seconds()
-        total = (datetime.now() - self.session_start_time).total_seconds()
-        active = int(total - self.total_paused_seconds)
+        active = int(self._session_elapsed_seconds() - self.total_paused_seconds)
         actual_remaining = base_remaining - active
 
         if actual_remaining <= 0:
@@ -948,21 +1034,19 @@ class SessionEngine:
         stop_time = datetime.now()
 
         if self.is_running:
-            if self.is_paused and self.pause_start_time:
-                self.total_paused_seconds += (stop_time - self.pause_start_time).total_seconds()
-                self.is_paused = False
-                self.pause_start_time = None
+            stop_elapsed = self._session_elapsed_seconds() if self.session_start_time else 0.0
+            if self.is_paused:
+                self._end_pause()
 
             self.should_stop.set()
             self.is_running = False
             self._join_threads()
 
             if self.session and self.session_started and self.session_start_time:
-                total_elapsed = (stop_time - self.session_start_time).total_seconds()
-                active_duration = max(1, int(total_elapsed - self.total_paused_seconds))
+                active_duration = max(1, int(stop_elapsed - self.total_paused_seconds))
                 self.usage_limiter.record_usage(active_duration)
                 self.session.end(stop_time)
-                self.usage_limiter.end_session()
+                self.usage_limiter.end_session(stop_time)
 
             report_path = self._generate_report()
             logger.info("Session stopped due to time exhaustion — report generated")
@@ -977,27 +1061,71 @@ class SessionEngine:
     # Report generation
     # ------------------------------------------------------------------
 
-    def _generate_report(self) -> Optional[Path]:
+    def _start_report_worker(self) -> None:
+        """
+        Generate the report for the just-stopped session on a background thread.
+
+        The session object is captured now so a new session started before
+        the report finishes can't swap it out. on_session_ended is called
+        from the worker when the report is done, which may be after that new
+        session has started; handlers must check is_running before resetting
+        any session UI.
+        """
+        session = self.session if self.session_started else None
+        self._report_thread = threading.Thread(
+            target=self._report_worker, args=(session,), daemon=True
+        )
+        self._report_thread.start()
+
+    def _report_worker(self, session: Optional[Session]) -> None:
+        """
+        Build the PDF report and notify the UI (runs on the report thread).
+
+        Args:
+            session: The completed session, or None if it never started.
+        """
+        # None means "no report" here: _generate_report(None) would fall back
+        # to self.session, which may already be a newer, still-running session
+        if session is None:
+            logger.info("No session data — skipping report generation")
+            report_path = None
+        else:
+            report_path = self._generate_report(session)
+        if self.on_session_ended:
+            try:
+                self.on_session_ended(report_path)
+            except Exception as e:
+                logger.error(f"on_session_ended callback error: {e}")
+
+    def _generate_report(self, session: Optional[Session] = None) -> Optional[Path]:
         """
         Generate a PDF report for the completed session.
 
+        Args:
+            session: Session to report on. Defaults to the engine's current
+                session (if it started).
+
         Returns:
             Path to the generated PDF, or None if generation failed.
         """
-        if not self.session or not self.session_started:
+        if session is None and self.session_started:
+            session = self.session
+        if not session:
             logger.info("No session data — skipping report generation")
             return None
 
         try:
+            from reporting.pdf_report import generate_report
+
             stats = compute_statistics(
-                self.session.events,
-                self.session.get_duration(),
+                session.events,
+                session.get_duration(),
             )
             report_path = generate_report(
                 stats,
-                self.session.session_id,
-                self.session.start_time,
-                self.session.end_time,
+                session.session_id,
+                session.start_time,
+                session.end_time,
             )
 
             # Persist for "Download Last Report"
@@ -1012,10 +1140,29 @@ class SessionEngine:
             return None
 
     def _save_last_report_path(self, path: Path) -> None:
-        """Persist the last report path for retrieval after restart."""
+        """
+        Persist the last report path for retrieval after restart.
+
+        Written atomically (temp file + os.replace) because the report
+        worker thread can save while the UI reads it for "Download Last
+        Report", and a crash mid-write must not leave a truncated file.
+        """
         try:
-            _LAST_REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
-            _LAST_REPORT_FILE.write_text(json.dumps({"path": str(path)}))
+            parent = _LAST_REPORT_FILE.parent
+            if not parent.is_dir():
+                parent.mkdir(parents=True, exist_ok=True)
+
+            temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", prefix="last_report_", dir=parent)
+            try:
+                with os.fdopen(temp_fd, "w") as f:
+                    json.dump({"path": str(path)}, f)
+                os.replace(temp_path, _LAST_REPORT_FILE)
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
         except Exception as e:
             logger.debug(f"Could not save last report path: {e}")
 
@@ -1068,16 +1215,18 @@ class SessionEngine:
 
     def _handle_camera_error(
         self,
-        failure_type: "CameraFailureType" = CameraFailureType.UNKNOWN,
+        failure_type: Optional["CameraFailureType"] = None,
         failure_message: Optional[str] = None,
     ) -> None:
         """
         Handle camera open failure by notifying via error callback.
 
         Args:
-            failure_type: Type of camera failure.
+            failure_type: Type of camera failure (None is treated as unknown).
             failure_message: Detailed error message.
         """
+        from camera.capture import CameraFailureType
+
         self.is_running = False
         self._notify_status_change("idle", "Ready to Start")
 
@@ -1113,6 +1262,7 @@ class SessionEngine:
     def _notify_status_change(self, status: str, text: str) -> None:
         """Thread-safe status change notification."""
         self.current_status = status
+        self._current_status_text = text
         if self.on_status_change:
             try:
                 self.on_status_change(status, text)
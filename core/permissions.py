@@ -18,37 +18,67 @@ logger = logging.getLogger(__name__)
 # macOS Camera
 # ---------------------------------------------------------------------------
 
-def check_macos_camera_permission() -> str:
+_CAMERA_STATUS_MAP = {
+    0: "not_determined",
+    1: "restricted",
+    2: "denied",
+    3: "authorized",
+}
+
+# AVCaptureDevice class, resolved once per process by _get_av_capture_device()
+_av_capture_device = None
+
+
+def _get_av_capture_device():
     """
-    Check macOS camera authorization status via AVFoundation.
+    Resolve the AVCaptureDevice class, caching it for later calls.
+
+    Prefers the pyobjc-framework-AVFoundation binding (a plain import once
+    loaded) and only falls back to loading the framework bundle by path
+    when that binding is not installed.
 
     Returns:
-        One of: "authorized", "denied", "not_determined", "restricted", "unknown"
+        The AVCaptureDevice Objective-C class.
+
+    Raises:
+        ImportError: If PyObjC is not available at all.
     """
-    if sys.platform != "darwin":
-        return "authorized"
+    global _av_capture_device
+    if _av_capture_device is not None:
+        return _av_capture_device
 
     try:
+        from AVFoundation import AVCaptureDevice  # type: ignore[import-not-found]
+    except ImportError:
         import objc
 
         objc.loadBundle(
             'AVFoundation',
             bundle_path='/System/Library/Frameworks/AVFoundation.framework',
-            module_globals=globals()
+            module_globals={}
         )
-
         AVCaptureDevice = objc.lookUpClass('AVCaptureDevice')
+
+    _av_capture_device = AVCaptureDevice
+    return _av_capture_device
+
+
+def check_macos_camera_permission() -> str:
+    """
+    Check macOS camera authorization status via AVFoundation.
+
+    Returns:
+        One of: "authorized", "denied", "not_determined", "restricted", "unknown"
+    """
+    if sys.platform != "darwin":
+        return "authorized"
+
+    try:
+        AVCaptureDevice = _get_av_capture_device()
         AVMediaTypeVideo = "vide"
 
         status = AVCaptureDevice.authorizationStatusForMediaType_(AVMediaTypeVideo)
-
-        status_map = {
-            0: "not_determined",
-            1: "restricted",
-            2: "denied",
-            3: "authorized",
-        }
-        return status_map.get(status, "unknown")
+        return _CAMERA_STATUS_MAP.get(status, "unknown")
 
     except ImportError:
         logger.debug("PyObjC not available, cannot check camera permission status")
@@ -32,11 +32,10 @@ from typing import Optional
 
 import config
 from instance_lock import check_single_instance, get_existing_pid
-from camera.capture import CameraCapture
-from camera import create_vision_detector, get_event_type
 from tracking.session import Session
 from tracking.analytics import compute_statistics
-from reporting.pdf_report import generate_report
+# camera.capture (OpenCV), the vision detectors and reporting.pdf_report (ReportLab)
+# are imported inside the CLI paths so menu bar mode does not load them at launch
 
 # Configure logging
 logging.basicConfig(
@@ -163,6 +162,9 @@ class BrainDock:
         print("   Press Enter or 'q' to end the session\n")
         
         try:
+            from camera.capture import CameraCapture
+            from camera import create_vision_detector, get_event_type
+
             # Initialize detector and camera
             detector = create_vision_detector()
             
@@ -197,8 +199,10 @@ class BrainDock:
                         
                         last_detection_time = current_time
                     
-                    # Small sleep to prevent CPU overload
-                    time.sleep(0.1)
+                    # Small wait to prevent CPU overload; returns early when the
+                    # keyboard listener sets stop_event
+                    if stop_event.wait(0.1):
+                        break
             
         except KeyboardInterrupt:
             print("\n\n⏸️  Session interrupted by user")
@@ -253,6 +257,8 @@ class BrainDock:
         # Generate PDF report (summary + logs combined)
         print("📄 Generating PDF report...")
         try:
+            from reporting.pdf_report import generate_report
+
             report_path = generate_report(
                 stats,
                 self.session.session_id,
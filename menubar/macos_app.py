@@ -9,14 +9,16 @@ are shown. All session features require an authenticated account.
 """
 
 import sys
-import os
+import subprocess
+import threading
 import webbrowser
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import rumps
+from PyObjCTools import AppHelper
 
 import config
 from core.engine import SessionEngine
@@ -24,12 +26,34 @@ from sync.supabase_client import BrainDockSync
 
 logger = logging.getLogger(__name__)
 
+# Website base URL (login, signup, pricing, dashboard), resolved once at import
+_WEBSITE_URL = config.DASHBOARD_URL.rstrip("/")
+
 # Resolve icon path
 _ASSETS_DIR = config.BASE_DIR / "assets"
 _ICON_PATH = _ASSETS_DIR / "menu_icon.png"
 _FALLBACK_ICON = _ASSETS_DIR / "logo_icon.png"
 
 
+def _on_main_thread(func: Callable[..., None]) -> Callable[..., None]:
+    """
+    Wrap an engine callback so it runs on the AppKit main thread.
+
+    Engine callbacks fire from detection and report worker threads; menu
+    items, alerts and timers must only be touched from the main run loop.
+    AppHelper.callAfter queues the call there without blocking the caller.
+
+    Args:
+        func: Callback to dispatch.
+
+    Returns:
+        Wrapper with the same signature that schedules func on the main thread.
+    """
+    def _dispatch(*args) -> None:
+        AppHelper.callAfter(func, *args)
+    return _dispatch
+
+
 def _get_icon_path() -> Optional[str]:
     """Get the menu bar icon path, or None to use text title."""
     if _ICON_PATH.exists():
@@ -54,10 +78,10 @@ class BrainDockMenuBar(rumps.App):
 
         # Core engine (created but not used until authenticated)
         self.engine = SessionEngine()
-        self.engine.on_status_change = self._on_status_change
-        self.engine.on_session_ended = self._on_session_ended
-        self.engine.on_error = self._on_error
-        self.engine.on_alert = self._on_alert
+        self.engine.on_status_change = self._queue_status_change
+        self.engine.on_session_ended = _on_main_thread(self._on_session_ended)
+        self.engine.on_error = _on_main_thread(self._on_error)
+        self.engine.on_alert = _on_main_thread(self._on_alert)
 
         # Sync client (used for credits and session upload)
         self.sync = BrainDockSync()
@@ -106,17 +130,34 @@ class BrainDockMenuBar(rumps.App):
         self.logout_item = rumps.MenuItem("Log Out", callback=self._logout)
         self.quit_item = rumps.MenuItem("Quit BrainDock", callback=self._quit_app)
 
+        # Latest engine status awaiting the main thread (bursts collapse to one update)
+        self._pending_status: Optional[Tuple[str, str]] = None
+        self._status_lock = threading.Lock()
+
+        # Auth state the menu was last built for (None = not built yet)
+        self._menu_logged_in: Optional[bool] = None
+
+        # Session timer display: only ticks while a session is running
+        self._session_timer = rumps.Timer(self._tick, 1)
+
         # Build the menu based on auth state
         self._build_menu()
 
-        # Sync settings + credits from cloud on launch if already logged in
-        if self._is_logged_in():
-            self._apply_cloud_settings()
-            self.sync.register_device()
+        # Sync settings + credits from cloud once the run loop is up, so the
+        # menu bar icon appears without waiting on the network
+        self._launch_sync_timer = rumps.Timer(self._launch_sync, 0.1)
+        self._launch_sync_timer.start()
 
         # Register braindock:// URL handler (for deep link auth callback)
         self._register_url_handler()
 
+    def _launch_sync(self, timer: rumps.Timer) -> None:
+        """One-shot: apply cloud settings and register the device if logged in."""
+        timer.stop()
+        if self._is_logged_in():
+            self._apply_cloud_settings()
+            self.sync.register_device()
+
     def _register_url_handler(self) -> None:
         """Register to receive braindock:// URLs from the OS (Apple Event GURL)."""
         try:
@@ -180,13 +221,26 @@ class BrainDockMenuBar(rumps.App):
         return bool(self.sync.get_stored_email())
 
     def _build_menu(self) -> None:
-        """Build the menu. Only shows session features if logged in."""
-        self.menu.clear()
+        """
+        Build the menu. Only shows session features if logged in.
+
+        The item layout only depends on auth state, so the menu is cleared
+        and re-populated only when that changes; otherwise the existing
+        items are kept and just their dynamic titles are refreshed.
+        """
+        logged_in = self._is_logged_in()
+
+        if logged_in == self._menu_logged_in:
+            if logged_in:
+                self._refresh_authenticated_titles()
+            return
 
-        if self._is_logged_in():
+        self.menu.clear()
+        if logged_in:
             self._build_authenticated_menu()
         else:
             self._build_unauthenticated_menu()
+        self._menu_logged_in = logged_in
 
     def _build_unauthenticated_menu(self) -> None:
         """Menu for users who haven't logged in yet."""
@@ -198,11 +252,14 @@ class BrainDockMenuBar(rumps.App):
         self.menu.add(rumps.separator)
         self.menu.add(self.quit_item)
 
+    def _refresh_authenticated_titles(self) -> None:
+        """Update the account and credits titles on the authenticated menu."""
+        self.account_item.title = self.sync.get_stored_email()
+        self._update_credits_display()
+
     def _build_authenticated_menu(self) -> None:
         """Full menu for logged-in users."""
-        email = self.sync.get_stored_email()
-        self.account_item.title = email
-        self._update_credits_display()
+        self._refresh_authenticated_titles()
 
         self.menu.add(self.status_item)
         self.menu.add(self.timer_item)
@@ -223,23 +280,33 @@ class BrainDockMenuBar(rumps.App):
         self.menu.add(self.quit_item)
 
     # ------------------------------------------------------------------
-    # Timer (polls engine every second)
+    # Timer (polls engine every second while a session runs)
     # ------------------------------------------------------------------
 
-    @rumps.timer(1)
     def _tick(self, timer) -> None:
-        """Poll engine status every second and update timer display."""
+        """
+        Poll engine status every second and update timer display.
+
+        Driven by self._session_timer, which is started with a session and
+        stopped in _reset_to_idle() so the app has no 1 Hz wakeups when idle.
+        Engine-side stops that don't end in on_session_ended (camera error,
+        missing screen permission) are caught here: the timer stops itself
+        once the engine is no longer running.
+        """
         status = self.engine.get_status()
 
         if status["is_running"]:
             elapsed = status["elapsed_seconds"]
-            h = elapsed // 3600
-            m = (elapsed % 3600) // 60
-            s = elapsed % 60
-            self.timer_item.title = f"{h:02d}:{m:02d}:{s:02d}"
+            m, s = divmod(elapsed, 60)
+            h, m = divmod(m, 60)
+            title = f"{h:02d}:{m:02d}:{s:02d}"
+            # Elapsed time freezes while paused; skip redundant NSMenuItem updates
+            if self.timer_item.title != title:
+                self.timer_item.title = title
         else:
             if self.timer_item.title:
                 self.timer_item.title = ""
+            timer.stop()
 
     def _update_credits_display(self) -> None:
         """Refresh the credits menu item title from current remaining time."""
@@ -255,12 +322,13 @@ class BrainDockMenuBar(rumps.App):
         except Exception:
             self.credits_item.title = "Credits: —"
 
-    @rumps.timer(30)
+    @rumps.timer(config.CREDITS_REFRESH_INTERVAL)
     def _tick_credits(self, timer) -> None:
         """Sync credits from cloud and update display every 30 seconds."""
         if not self._is_logged_in():
             return
-        self.engine.usage_limiter.sync_with_cloud()
+        # Skip the round trip if a session start/stop or settings fetch just synced
+        self.engine.usage_limiter.sync_with_cloud(max_age=config.CREDITS_REFRESH_INTERVAL / 2)
         self._update_credits_display()
 
     # ------------------------------------------------------------------
@@ -275,6 +343,7 @@ class BrainDockMenuBar(rumps.App):
 
             result = self.engine.start_session()
             if result["success"]:
+                self._session_timer.start()
                 self.start_stop_item.title = "Stop Session"
                 self.pause_item.set_callback(self._toggle_pause)
                 self.pause_item.title = "Pause"
@@ -307,6 +376,8 @@ class BrainDockMenuBar(rumps.App):
 
     def _reset_to_idle(self) -> None:
         """Reset menu items to idle state."""
+        if self._session_timer.is_alive():
+            self._session_timer.stop()
         self.start_stop_item.title = "Start Session"
         self.pause_item.set_callback(None)
         self.pause_item.title = "Pause"
@@ -349,20 +420,28 @@ class BrainDockMenuBar(rumps.App):
 
     def _open_dashboard(self, sender) -> None:
         """Open web dashboard in default browser."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com/dashboard")
-        webbrowser.open(url)
+        webbrowser.open(_WEBSITE_URL)
 
     def _open_pricing(self, sender) -> None:
         """Open pricing page to buy more hours."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com").rstrip("/")
-        webbrowser.open(f"{url}/pricing/")
+        webbrowser.open(f"{_WEBSITE_URL}/pricing/")
 
     def _download_report(self, sender) -> None:
         """Open the most recently generated PDF report."""
         report_path = self.engine.get_last_report_path()
         if report_path and report_path.exists():
-            os.system(f'open "{report_path}"')
-            logger.info(f"Opened report: {report_path}")
+            # Popen: don't block the main (menu) thread while LaunchServices opens the PDF.
+            # Argument list also avoids shell quoting issues with the path.
+            try:
+                subprocess.Popen(
+                    ["open", str(report_path)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                )
+                logger.info(f"Opened report: {report_path}")
+            except OSError as e:
+                logger.warning(f"Could not open report: {e}")
         else:
             rumps.alert(
                 title="No Report",
@@ -375,8 +454,7 @@ class BrainDockMenuBar(rumps.App):
 
     def _login(self, sender) -> None:
         """Start browser-based login flow (deep link when bundled, localhost callback in dev)."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com")
-        base = url.rstrip("/")
+        base = _WEBSITE_URL
         if config.is_bundled():
             # Bundled app: open site; website redirects to braindock://callback?code=...
             webbrowser.open(f"{base}/auth/login/?source=desktop")
@@ -387,7 +465,7 @@ class BrainDockMenuBar(rumps.App):
             )
             return
         # Development: localhost callback server
-        success = self.sync.login_with_browser(dashboard_url=url)
+        success = self.sync.login_with_browser(dashboard_url=base)
         if success:
             self._build_menu()
             self._apply_cloud_settings()
@@ -402,8 +480,7 @@ class BrainDockMenuBar(rumps.App):
 
     def _signup(self, sender) -> None:
         """Open signup page in browser (with source=desktop when bundled)."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com")
-        base = url.rstrip("/")
+        base = _WEBSITE_URL
         if config.is_bundled():
             webbrowser.open(f"{base}/auth/signup/?source=desktop")
         else:
@@ -483,13 +560,40 @@ class BrainDockMenuBar(rumps.App):
     # Engine callbacks
     # ------------------------------------------------------------------
 
+    def _queue_status_change(self, status: str, text: str) -> None:
+        """
+        Engine status callback (any thread): keep only the latest status.
+
+        A main-thread drain is scheduled only when none is pending, so a
+        burst of status changes results in a single menu update.
+        """
+        with self._status_lock:
+            schedule = self._pending_status is None
+            self._pending_status = (status, text)
+        if schedule:
+            AppHelper.callAfter(self._drain_status_change)
+
+    def _drain_status_change(self) -> None:
+        """Apply the most recent queued status on the main thread."""
+        with self._status_lock:
+            pending, self._pending_status = self._pending_status, None
+        if pending:
+            self._on_status_change(*pending)
+
     def _on_status_change(self, status: str, text: str) -> None:
         """Update status display in menu."""
         self.status_item.title = text
 
     def _on_session_ended(self, report_path: Optional[Path]) -> None:
-        """Handle session end."""
-        self._reset_to_idle()
+        """
+        Handle session end.
+
+        The report finishes in the background, so this can arrive after a
+        new session has started; the idle reset is skipped then so the
+        running session's timer and controls are left alone.
+        """
+        if not self.engine.is_running:
+            self._reset_to_idle()
         if report_path:
             rumps.notification(
                 title="BrainDock",
@@ -27,6 +27,12 @@ from sync.supabase_client import BrainDockSync
 
 logger = logging.getLogger(__name__)
 
+# Clicks on Start/Stop within this many seconds of the last toggle are ignored
+_TOGGLE_DEBOUNCE_SECONDS = 1.0
+
+# Website base URL (login, signup, pricing, dashboard), resolved once at import
+_WEBSITE_URL = config.DASHBOARD_URL.rstrip("/")
+
 # Resolve icon path
 _ASSETS_DIR = config.BASE_DIR / "assets"
 _ICON_PATH = _ASSETS_DIR / "tray_icon.ico"
@@ -62,6 +68,16 @@ class BrainDockTray:
         # Status text
         self._status_text: str = "Ready to start"
 
+        # Guards Start/Stop against double-fire (overlapping or queued repeat clicks)
+        self._toggle_lock = threading.Lock()
+        self._last_toggle_time: float = 0.0
+
+        # Serialises cloud settings applies (background launch sync vs. session start)
+        self._settings_lock = threading.Lock()
+
+        # Last tooltip pushed to the tray (skip no-op title updates)
+        self._last_tooltip: str = "BrainDock"
+
         # Load icon
         self._icon_image = _load_icon_image()
 
@@ -73,14 +89,16 @@ class BrainDockTray:
             menu=self._build_menu(),
         )
 
-        # Timer thread for updating tooltip during sessions and checking pending deep link
-        self._timer_running: bool = True
+        # Timer thread for updating tooltip during sessions and checking pending deep link.
+        # _timer_stop is set on quit and wakes the loop's wait() immediately.
+        self._timer_stop = threading.Event()
         self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
 
         # Pending deep link file (when another instance received braindock:// and handed off)
         self._pending_deeplink_file: Path = config.USER_DATA_DIR / "pending_deeplink.txt"
 
-        # Sync settings + credits from cloud on launch if already logged in
+    def _launch_sync(self) -> None:
+        """Apply cloud settings and register the device if logged in (background)."""
         if self._is_logged_in():
             self._apply_cloud_settings()
             self.sync.register_device()
@@ -196,8 +214,7 @@ class BrainDockTray:
 
     def _process_pending_deeplink(self) -> None:
         """If a pending deep link file exists (from second instance), process it and delete file."""
-        if not self._pending_deeplink_file.exists():
-            return
+        # Runs every tick: a single open() answers "is there anything to do?"
         try:
             url_string = self._pending_deeplink_file.read_text().strip()
             self._pending_deeplink_file.unlink()
@@ -205,6 +222,8 @@ class BrainDockTray:
                 logger.info("Processed pending deep link login")
             else:
                 self.icon.notify("Login failed. Please try again.", "BrainDock Error")
+        except FileNotFoundError:
+            return
         except Exception as e:
             logger.warning("Failed to process pending deep link: %s", e)
             try:
@@ -216,33 +235,70 @@ class BrainDockTray:
     # Timer loop (background thread)
     # ------------------------------------------------------------------
 
+    def _set_tooltip(self, text: str) -> None:
+        """
+        Set the tray tooltip, skipping the update when the text is unchanged.
+
+        Elapsed time freezes while paused, so most ticks would otherwise
+        push an identical title to the shell.
+
+        Args:
+            text: Tooltip text to display.
+        """
+        if text == self._last_tooltip:
+            return
+        self.icon.title = text
+        self._last_tooltip = text
+
     def _timer_loop(self) -> None:
         """Background thread: update tray tooltip; check for pending deep link; periodic cloud sync."""
         tick_count = 0
-        while self._timer_running:
+        while not self._timer_stop.is_set():
             if self.engine.is_running:
                 status = self.engine.get_status()
                 elapsed = status.get("elapsed_seconds", 0)
-                h = elapsed // 3600
-                m = (elapsed % 3600) // 60
-                s = elapsed % 60
-                self.icon.title = f"BrainDock — {h:02d}:{m:02d}:{s:02d}"
+                m, s = divmod(elapsed, 60)
+                h, m = divmod(m, 60)
+                self._set_tooltip(f"BrainDock — {h:02d}:{m:02d}:{s:02d}")
             self._process_pending_deeplink()
 
             # Sync credits from cloud every 30 seconds
             tick_count += 1
-            if tick_count >= 30 and self._is_logged_in():
-                self.engine.usage_limiter.sync_with_cloud()
+            if tick_count >= config.CREDITS_REFRESH_INTERVAL and self._is_logged_in():
+                # Skip the round trip if a session start/stop or settings fetch just synced
+                self.engine.usage_limiter.sync_with_cloud(
+                    max_age=config.CREDITS_REFRESH_INTERVAL / 2
+                )
                 tick_count = 0
 
-            time.sleep(1)
+            self._timer_stop.wait(1)
 
     # ------------------------------------------------------------------
     # Session controls
     # ------------------------------------------------------------------
 
     def _toggle_session(self, icon, item) -> None:
-        """Start or stop a session."""
+        """
+        Start or stop a session.
+
+        A repeat click while a toggle is in progress, or right after one
+        finished, is dropped so a double-click can't start then
+        immediately stop (or start twice).
+        """
+        if not self._toggle_lock.acquire(blocking=False):
+            logger.debug("Ignoring Start/Stop click — toggle already in progress")
+            return
+        try:
+            if time.monotonic() - self._last_toggle_time < _TOGGLE_DEBOUNCE_SECONDS:
+                logger.debug("Ignoring repeated Start/Stop click")
+                return
+            self._do_toggle_session()
+            self._last_toggle_time = time.monotonic()
+        finally:
+            self._toggle_lock.release()
+
+    def _do_toggle_session(self) -> None:
+        """Start or stop a session (called with the toggle lock held)."""
         if not self.engine.is_running:
             self._apply_cloud_settings()
 
@@ -286,8 +342,7 @@ class BrainDockTray:
 
     def _open_dashboard(self, icon, item) -> None:
         """Open web dashboard in browser."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com/dashboard")
-        webbrowser.open(url)
+        webbrowser.open(_WEBSITE_URL)
 
     def _credits_menu_title(self) -> str:
         """Return current credits remaining for menu display."""
@@ -304,8 +359,7 @@ class BrainDockTray:
 
     def _open_pricing(self, icon, item) -> None:
         """Open pricing page to buy more hours."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com").rstrip("/")
-        webbrowser.open(f"{url}/pricing/")
+        webbrowser.open(f"{_WEBSITE_URL}/pricing/")
 
     def _download_report(self, icon, item) -> None:
         """Open the most recently generated PDF report."""
@@ -321,15 +375,14 @@ class BrainDockTray:
 
     def _login(self, icon, item) -> None:
         """Start browser-based login flow (deep link when bundled, localhost callback in dev)."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com")
-        base = url.rstrip("/")
+        base = _WEBSITE_URL
         if config.is_bundled():
             # Bundled app: open site; website redirects to braindock://callback?code=...
             webbrowser.open(f"{base}/auth/login/?source=desktop")
             self.icon.notify("Complete login in the browser; the app will update when done.", "BrainDock")
             return
         # Development: localhost callback server
-        success = self.sync.login_with_browser(dashboard_url=url)
+        success = self.sync.login_with_browser(dashboard_url=base)
         if success:
             self._rebuild_menu()
             self._apply_cloud_settings()
@@ -340,8 +393,7 @@ class BrainDockTray:
 
     def _signup(self, icon, item) -> None:
         """Open signup page in browser (with source=desktop when bundled)."""
-        url = getattr(config, "DASHBOARD_URL", "https://thebraindock.com")
-        base = url.rstrip("/")
+        base = _WEBSITE_URL
         if config.is_bundled():
             webbrowser.open(f"{base}/auth/signup/?source=desktop")
         else:
@@ -381,7 +433,7 @@ class BrainDockTray:
             self.engine.stop_session()
         self.sync.logout()
         self._rebuild_menu()
-        self.icon.title = "BrainDock"
+        self._set_tooltip("BrainDock")
         logger.info("User logged out")
 
     # ------------------------------------------------------------------
@@ -392,20 +444,23 @@ class BrainDockTray:
         """Fetch settings from cloud and apply to engine."""
         if not self.sync.is_available() or not self._is_logged_in():
             return
-        try:
-            settings = self.sync.fetch_settings()
-            mode = settings.get("monitoring_mode", self.engine.monitoring_mode)
-            self.engine.set_monitoring_mode(mode)
+        # The launch sync runs on a background thread; a Start click right
+        # after launch waits for it here instead of applying concurrently
+        with self._settings_lock:
+            try:
+                settings = self.sync.fetch_settings()
+                mode = settings.get("monitoring_mode", self.engine.monitoring_mode)
+                self.engine.set_monitoring_mode(mode)
 
-            blocklist = BrainDockSync.cloud_settings_to_blocklist(settings)
-            self.engine.set_blocklist(blocklist)
+                blocklist = BrainDockSync.cloud_settings_to_blocklist(settings)
+                self.engine.set_blocklist(blocklist)
 
-            # Sync credit balance from cloud
-            self.engine.usage_limiter.sync_with_cloud()
+                # Sync credit balance from cloud
+                self.engine.usage_limiter.sync_with_cloud()
 
-            logger.info("Cloud settings applied")
-        except Exception as e:
-            logger.warning(f"Could not apply cloud settings: {e}")
+                logger.info("Cloud settings applied")
+            except Exception as e:
+                logger.warning(f"Could not apply cloud settings: {e}")
 
     # ------------------------------------------------------------------
     # Engine callbacks
@@ -415,12 +470,18 @@ class BrainDockTray:
         """Update status text and tooltip."""
         self._status_text = text
         if not self.engine.is_running:
-            self.icon.title = "BrainDock — Ready"
+            self._set_tooltip("BrainDock — Ready")
 
     def _on_session_ended(self, report_path: Optional[Path]) -> None:
-        """Handle session end notification."""
-        self._status_text = "Ready to start"
-        self.icon.title = "BrainDock — Ready"
+        """
+        Handle session end notification.
+
+        The report finishes in the background, so this can arrive after a
+        new session has started; the status is only reset when idle.
+        """
+        if not self.engine.is_running:
+            self._status_text = "Ready to start"
+            self._set_tooltip("BrainDock — Ready")
         if report_path:
             self.icon.notify(f"Report saved: {report_path.name}", "Session Complete")
 
@@ -438,7 +499,7 @@ class BrainDockTray:
 
     def _quit_app(self, icon, item) -> None:
         """Clean up and quit."""
-        self._timer_running = False
+        self._timer_stop.set()
         if self.engine.is_running:
             result = self.engine.stop_session()
             if result.get("session_data") and self.sync.is_available():
@@ -458,4 +519,6 @@ class BrainDockTray:
                 self._process_braindock_url(arg)
                 break
         self._timer_thread.start()
+        # Cloud sync runs alongside the tray loop so the icon appears immediately
+        threading.Thread(target=self._launch_sync, daemon=True).start()
         self.icon.run()
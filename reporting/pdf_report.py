@@ -32,17 +32,16 @@ from tracking.analytics import format_duration
 logger = logging.getLogger(__name__)
 
 
-def _add_gradient_background(canvas_obj, doc):
+def _build_gradient_bands() -> list:
     """
-    Add a visible gradient background to the page.
-    Blue gradient that fades from top to middle of page.
-    
-    Args:
-        canvas_obj: ReportLab canvas object
-        doc: Document object
+    Precompute the gradient background bands for a letter page.
+
+    The gradient is identical on every page, so the per-band fill colors
+    and rectangles are built once at import instead of per page.
+
+    Returns:
+        List of (color, x, y, width, height) tuples, top band first.
     """
-    canvas_obj.saveState()
-    
     # Create a smooth gradient from blue to white
     # Fades from top to middle of page
     width, height = letter
@@ -56,6 +55,7 @@ def _add_gradient_background(canvas_obj, doc):
     gradient_height = height * 0.5  # Gradient covers top half of page
     step_height = gradient_height / num_steps
     
+    bands = []
     for i in range(num_steps):
         # Calculate alpha that goes from full color to completely transparent
         alpha = 1 - (i / num_steps)
@@ -68,9 +68,28 @@ def _add_gradient_background(canvas_obj, doc):
             alpha=alpha * 0.9  # Increased from 0.7 to 0.9 for more visibility
         )
         
-        canvas_obj.setFillColor(color)
         y_pos = height - (i * step_height)
-        canvas_obj.rect(0, y_pos - step_height, width, step_height, fill=1, stroke=0)
+        bands.append((color, 0, y_pos - step_height, width, step_height))
+    return bands
+
+
+_GRADIENT_BANDS = _build_gradient_bands()
+
+
+def _add_gradient_background(canvas_obj, doc):
+    """
+    Add a visible gradient background to the page.
+    Blue gradient that fades from top to middle of page.
+    
+    Args:
+        canvas_obj: ReportLab canvas object
+        doc: Document object
+    """
+    canvas_obj.saveState()
+    
+    for color, x, y, w, h in _GRADIENT_BANDS:
+        canvas_obj.setFillColor(color)
+        canvas_obj.rect(x, y, w, h, fill=1, stroke=0)
     
     canvas_obj.restoreState()
 
@@ -314,6 +333,91 @@ def _get_random_focus_statement(
     return (statement, category_label, color)
 
 
+# Paragraph styles are identical for every report; built once on first use
+_report_styles: Optional[Dict[str, ParagraphStyle]] = None
+
+
+def _get_report_styles() -> Dict[str, ParagraphStyle]:
+    """
+    Get the shared paragraph styles used by the report.
+    
+    getSampleStyleSheet() and the custom ParagraphStyles are rebuilt on
+    every call otherwise, so they are cached at module level after the
+    first report.
+    
+    Returns:
+        Dict of style name -> ParagraphStyle.
+    """
+    global _report_styles
+    if _report_styles is not None:
+        return _report_styles
+    
+    styles = getSampleStyleSheet()
+    
+    # Custom styles with Georgia-like font (Times-Roman)
+    _report_styles = {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontName='Times-Bold',
+            fontSize=28,
+            textColor=colors.HexColor('#2C3E50'),
+            spaceAfter=20,
+            spaceBefore=20,
+            alignment=TA_LEFT,
+            leading=34
+        ),
+        'subtitle': ParagraphStyle(
+            'Subtitle',
+            parent=styles['Normal'],
+            fontName='Times-Italic',
+            fontSize=12,
+            textColor=colors.HexColor('#7F8C8D'),
+            spaceAfter=30,
+            alignment=TA_LEFT
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontName='Times-Bold',
+            fontSize=18,
+            textColor=colors.HexColor('#34495E'),
+            spaceAfter=20,
+            spaceBefore=20,
+            alignment=TA_LEFT,
+            leading=24
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontName='Times-Roman',
+            fontSize=12,
+            textColor=colors.HexColor('#2C3E50'),
+            leading=17,
+            spaceAfter=8
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontName='Times-Italic',
+            fontSize=9,
+            textColor=colors.HexColor('#95A5A6'),
+            alignment=TA_CENTER
+        ),
+        # Focus statement with increased word spacing
+        'statement': ParagraphStyle(
+            'FocusStatement',
+            fontName='Times-Italic',
+            fontSize=14,
+            textColor=colors.HexColor('#2C3E50'),
+            alignment=TA_CENTER,
+            leading=18,   # Comfortable line height
+            wordSpace=3   # Increased spacing between words
+        ),
+    }
+    return _report_styles
+
+
 def _create_focus_statement_paragraph(
     focus_pct: float,
     stats: Optional[Dict[str, Any]] = None
@@ -353,20 +457,33 @@ def _create_focus_statement_paragraph(
     # Replace the percentage with the colored version
     colored_statement = colored_statement.replace(f'{pct_str}%', colored_pct)
     
-    # Create paragraph style for the statement with increased word spacing
-    statement_style = ParagraphStyle(
-        'FocusStatement',
-        fontName='Times-Italic',
-        fontSize=14,
-        textColor=colors.HexColor('#2C3E50'),
-        alignment=TA_CENTER,
-        leading=18,   # Comfortable line height
-        wordSpace=3   # Increased spacing between words
-    )
-    
+    statement_style = _get_report_styles()['statement']
     return Paragraph(colored_statement, statement_style)
 
 
+# Gauge zone definitions: (start_pct, end_pct, color)
+_GAUGE_ZONES = [
+    (0, 49, colors.HexColor('#FF8C00')),      # Orange
+    (49, 75, colors.HexColor('#FFC107')),     # Yellow
+    (75, 90, colors.HexColor('#8BC34A')),     # Lime
+    (90, 100, colors.HexColor('#1B5E20')),    # Dark green
+]
+
+# Zones converted to wedge angles once (180° = 0%, 0° = 100%): (start_angle, end_angle, color)
+_GAUGE_ZONE_ANGLES = [
+    (180 - (end_pct * 1.8), 180 - (start_pct * 1.8), color)
+    for start_pct, end_pct, color in _GAUGE_ZONES
+]
+
+# Legend zone definitions: (range_text, label, color)
+_LEGEND_ZONES = [
+    ('90-100%', 'Excellent', colors.HexColor('#1B5E20')),    # Dark green
+    ('75-89%', 'Proficient', colors.HexColor('#8BC34A')),    # Lime
+    ('50-74%', 'Promising', colors.HexColor('#FFC107')),     # Yellow
+    ('0-49%', 'Developing', colors.HexColor('#FF8C00')),     # Orange
+]
+
+
 def _draw_focus_gauge(focus_pct: float) -> Drawing:
     """
     Create a semicircular gauge visualization for focus percentage.
@@ -398,20 +515,8 @@ def _draw_focus_gauge(focus_pct: float) -> Drawing:
     
     drawing = Drawing(width, height)
     
-    # Zone definitions: (start_pct, end_pct, color)
-    zones = [
-        (0, 49, colors.HexColor('#FF8C00')),      # Orange
-        (49, 75, colors.HexColor('#FFC107')),     # Yellow
-        (75, 90, colors.HexColor('#8BC34A')),     # Lime
-        (90, 100, colors.HexColor('#1B5E20')),    # Dark green
-    ]
-    
     # Draw each zone as a wedge (arc segment)
-    for start_pct, end_pct, color in zones:
-        # Convert percentage to angle (180° = 0%, 0° = 100%)
-        start_angle = 180 - (end_pct * 1.8)
-        end_angle = 180 - (start_pct * 1.8)
-        
+    for start_angle, end_angle, color in _GAUGE_ZONE_ANGLES:
         # Draw outer wedge
         wedge = Wedge(
             center_x, center_y,
@@ -422,17 +527,18 @@ def _draw_focus_gauge(focus_pct: float) -> Drawing:
             strokeWidth=int(2 * scale)
         )
         drawing.add(wedge)
-        
-        # Draw inner wedge (to create hollow arc effect)
-        inner_wedge = Wedge(
-            center_x, center_y,
-            inner_radius,
-            start_angle, end_angle,
-            fillColor=colors.white,
-            strokeColor=None,
-            strokeWidth=0
-        )
-        drawing.add(inner_wedge)
+    
+    # Hollow out the arc with a single white semicircle over all zones
+    # (same result as one inner wedge per zone, with a quarter of the shapes)
+    inner_semicircle = Wedge(
+        center_x, center_y,
+        inner_radius,
+        0, 180,
+        fillColor=colors.white,
+        strokeColor=None,
+        strokeWidth=0
+    )
+    drawing.add(inner_semicircle)
     
     # Draw the needle
     needle_angle = 180 - (focus_pct * 1.8)
@@ -481,17 +587,9 @@ def _create_focus_legend_table() -> Table:
     Returns:
         ReportLab Table object containing the legend
     """
-    # Zone definitions: (range_text, label, color)
-    zones = [
-        ('90-100%', 'Excellent', colors.HexColor('#1B5E20')),
-        ('75-89%', 'Proficient', colors.HexColor('#8BC34A')),
-        ('50-74%', 'Promising', colors.HexColor('#FFC107')),
-        ('0-49%', 'Developing', colors.HexColor('#FF8C00')),
-    ]
-    
     # Build legend table data
     legend_data = []
-    for range_text, label, color in zones:
+    for range_text, label, color in _LEGEND_ZONES:
         # Create a small colored box using a mini-table (slightly bigger)
         color_cell = Table([['']], colWidths=[14], rowHeights=[14])
         color_cell.setStyle(TableStyle([
@@ -522,13 +620,7 @@ def _create_focus_legend_table() -> Table:
     ]
     
     # Add color coding for percentage column
-    zone_colors = [
-        colors.HexColor('#1B5E20'),  # Excellent - dark green
-        colors.HexColor('#8BC34A'),  # Proficient - lime
-        colors.HexColor('#FFC107'),  # Promising - yellow
-        colors.HexColor('#FF8C00'),  # Developing - orange
-    ]
-    for i, color in enumerate(zone_colors):
+    for i, (_, _, color) in enumerate(_LEGEND_ZONES):
         legend_style.append(('TEXTCOLOR', (1, i), (1, i), color))
     
     legend_table.setStyle(TableStyle(legend_style))
@@ -666,6 +758,32 @@ class RoundedBoxFlowable(Flowable):
             item.drawOn(canvas, self.padding, y_position)
 
 
+# Logo aspect ratio keyed by (path, mtime_ns) so the PNG header is only
+# parsed again when the asset actually changes on disk
+_logo_aspect_cache: Dict[Tuple[str, int], float] = {}
+
+
+def _get_logo_aspect(logo_path: Path) -> float:
+    """
+    Get the width/height ratio of the report logo.
+    
+    Args:
+        logo_path: Path to the logo image.
+        
+    Returns:
+        Width divided by height of the image.
+    """
+    key = (str(logo_path), logo_path.stat().st_mtime_ns)
+    aspect = _logo_aspect_cache.get(key)
+    if aspect is None:
+        with PILImage.open(logo_path) as img:
+            orig_w, orig_h = img.size
+        aspect = orig_w / orig_h
+        _logo_aspect_cache.clear()
+        _logo_aspect_cache[key] = aspect
+    return aspect
+
+
 def _create_focus_card(
     focus_pct: float,
     stats: Optional[Dict[str, Any]] = None
@@ -764,52 +882,11 @@ def generate_report(
     
     # Build the story (content)
     story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles with Georgia-like font (Times-Roman)
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontName='Times-Bold',
-        fontSize=28,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=20,
-        spaceBefore=20,
-        alignment=TA_LEFT,
-        leading=34
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'Subtitle',
-        parent=styles['Normal'],
-        fontName='Times-Italic',
-        fontSize=12,
-        textColor=colors.HexColor('#7F8C8D'),
-        spaceAfter=30,
-        alignment=TA_LEFT
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontName='Times-Bold',
-        fontSize=18,
-        textColor=colors.HexColor('#34495E'),
-        spaceAfter=20,
-        spaceBefore=20,
-        alignment=TA_LEFT,
-        leading=24
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontName='Times-Roman',
-        fontSize=12,
-        textColor=colors.HexColor('#2C3E50'),
-        leading=17,
-        spaceAfter=8
-    )
+    styles = _get_report_styles()
+    title_style = styles['title']
+    subtitle_style = styles['subtitle']
+    heading_style = styles['heading']
+    body_style = styles['body']
     
     # ===== PAGE 1: Title + Summary Statistics =====
     
@@ -818,22 +895,20 @@ def generate_report(
     if logo_path.exists():
         try:
             # Calculate aspect ratio to maintain proportions
-            with PILImage.open(logo_path) as img:
-                orig_w, orig_h = img.size
-                aspect = orig_w / orig_h
-                
-                # Target height reduced further (was 0.85 inch)
-                target_h = 0.65 * inch
-                target_w = target_h * aspect
-                
-                # Create ReportLab Image
-                logo = Image(str(logo_path), width=target_w, height=target_h)
-                logo.hAlign = 'LEFT'  # Align left like the original title
-                
-                # Add spacer before logo to bring it down slightly
-                story.append(Spacer(1, 0.1 * inch))
-                story.append(logo)
-                story.append(Spacer(1, 25))  # Spacing after logo
+            aspect = _get_logo_aspect(logo_path)
+            
+            # Target height reduced further (was 0.85 inch)
+            target_h = 0.65 * inch
+            target_w = target_h * aspect
+            
+            # Create ReportLab Image
+            logo = Image(str(logo_path), width=target_w, height=target_h)
+            logo.hAlign = 'LEFT'  # Align left like the original title
+            
+            # Add spacer before logo to bring it down slightly
+            story.append(Spacer(1, 0.1 * inch))
+            story.append(logo)
+            story.append(Spacer(1, 25))  # Spacing after logo
         except Exception as e:
             logger.error(f"Error loading logo for report: {e}")
             # Fallback to text if logo fails
@@ -1063,14 +1138,7 @@ def generate_report(
     story.append(Spacer(1, 0.5 * inch))
     
     # Footer
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontName='Times-Italic',
-        fontSize=9,
-        textColor=colors.HexColor('#95A5A6'),
-        alignment=TA_CENTER
-    )
+    footer_style = styles['footer']
     
     footer_text = "Generated by BrainDock"
     story.append(Paragraph(footer_text, footer_style))
@@ -75,6 +75,53 @@ BROWSER_TITLE_SUFFIXES = [
 ]
 
 
+# Win32 user32/kernel32 bindings with prototypes declared, built on first use
+_win32_api = None
+
+
+def _get_win32_api():
+    """
+    Load user32/kernel32 and declare the prototypes used for window detection.
+
+    The DLL handles and argtypes/restype declarations are set up once per
+    process instead of on every screen check. Private WinDLL instances are
+    used so the prototypes do not leak into ctypes.windll for other modules.
+
+    Returns:
+        Tuple of (user32, kernel32) ctypes library objects.
+    """
+    global _win32_api
+    if _win32_api is not None:
+        return _win32_api
+
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32")
+    kernel32 = ctypes.WinDLL("kernel32")
+
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    user32.GetWindowTextLengthW.restype = ctypes.c_int
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+    ]
+    kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+
+    _win32_api = (user32, kernel32)
+    return _win32_api
+
+
 class WindowDetector:
     """
     Cross-platform detector for active window information.
@@ -292,7 +339,7 @@ class WindowDetector:
             '''
         
         if not script:
-            logger.debug(f"No AppleScript support for browser: {app_name_lower}")
+            logger.debug("No AppleScript support for browser: %s", app_name_lower)
             return None
         
         try:
@@ -312,7 +359,7 @@ class WindowDetector:
             logger.warning(f"AppleScript timed out getting URL for {app_name_lower}")
             return None
         except Exception as e:
-            logger.debug(f"Could not get browser URL: {e}")
+            logger.debug("Could not get browser URL: %s", e)
             return None
     
     def _get_active_window_windows(self) -> Optional[WindowInfo]:
@@ -331,7 +378,7 @@ class WindowDetector:
             from ctypes import wintypes
             
             # Get foreground window handle
-            user32 = ctypes.windll.user32
+            user32, _ = _get_win32_api()
             hwnd = user32.GetForegroundWindow()
             
             if not hwnd:
@@ -365,7 +412,10 @@ class WindowDetector:
                 url = self._get_browser_url_windows(hwnd, app_name_lower)
                 # Extract page title from window title as fallback
                 page_title = self._extract_page_title_from_window(window_title)
-                logger.debug(f"Windows browser detected: {app_name}, url={url is not None}, page_title='{page_title}'")
+                logger.debug(
+                    "Windows browser detected: %s, url=%s, page_title='%s'",
+                    app_name, url is not None, page_title
+                )
             
             return WindowInfo(
                 app_name=app_name,
@@ -482,7 +532,7 @@ class WindowDetector:
             
             PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
             
-            kernel32 = ctypes.windll.kernel32
+            _, kernel32 = _get_win32_api()
             handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
             
             if handle:
@@ -499,7 +549,7 @@ class WindowDetector:
             return "Unknown"
             
         except Exception as e:
-            logger.debug(f"Could not get process name: {e}")
+            logger.debug("Could not get process name: %s", e)
             return "Unknown"
     
     def _get_url_via_pywinauto(self, hwnd: int, app_name_lower: str) -> Optional[str]:
@@ -550,7 +600,7 @@ class WindowDetector:
                     if url:
                         # Clean up URL if needed
                         url = url.strip()
-                        logger.debug(f"Browser URL via pywinauto ({bar_name}): {url}")
+                        logger.debug("Browser URL via pywinauto (%s): %s", bar_name, url)
                         return url
                 except Exception:
                     continue
@@ -566,14 +616,14 @@ class WindowDetector:
                                 try:
                                     value = edit.get_value() if hasattr(edit, 'get_value') else None
                                     if value and ('.' in value or '://' in value):
-                                        logger.debug(f"Firefox URL found: {value}")
+                                        logger.debug("Firefox URL found: %s", value)
                                         return value.strip()
                                 except Exception:
                                     continue
                         except Exception:
                             continue
                 except Exception as e:
-                    logger.debug(f"Firefox URL fallback failed: {e}")
+                    logger.debug("Firefox URL fallback failed: %s", e)
             
             return None
             
@@ -582,7 +632,7 @@ class WindowDetector:
             logger.debug("pywinauto not available - trying alternative methods")
             return None
         except Exception as e:
-            logger.debug(f"Could not get browser URL via pywinauto: {e}")
+            logger.debug("Could not get browser URL via pywinauto: %s", e)
             return None
     
     def _get_url_via_uiautomation_ctypes(self, hwnd: int) -> Optional[str]:
@@ -635,7 +685,7 @@ class WindowDetector:
                                     if value_pattern:
                                         url = value_pattern.CurrentValue
                                         if url and ('.' in url or '://' in url):
-                                            logger.debug(f"URL via ctypes UI Automation: {url}")
+                                            logger.debug("URL via ctypes UI Automation: %s", url)
                                             return url.strip()
                                 except Exception:
                                     pass
@@ -645,7 +695,7 @@ class WindowDetector:
                 return None
                 
             except Exception as e:
-                logger.debug(f"COM-based UI Automation failed: {e}")
+                logger.debug("COM-based UI Automation failed: %s", e)
                 return None
                 
         except ImportError:
@@ -653,7 +703,7 @@ class WindowDetector:
             logger.debug("comtypes not available for UI Automation")
             return None
         except Exception as e:
-            logger.debug(f"ctypes UI Automation error: {e}")
+            logger.debug("ctypes UI Automation error: %s", e)
             return None
     
     def check_permission(self) -> bool:
@@ -664,7 +714,7 @@ class WindowDetector:
             True if permissions are granted, False otherwise.
         """
         if self._permission_checked:
-            logger.debug(f"Using cached permission result: {self._has_permission}")
+            logger.debug("Using cached permission result: %s", self._has_permission)
             return self._has_permission
         
         # Try to get window info - this will set _has_permission
@@ -673,7 +723,7 @@ class WindowDetector:
         self._permission_checked = True
         
         if window_info:
-            logger.debug(f"Permission check passed, got window: {window_info.app_name}")
+            logger.debug("Permission check passed, got window: %s", window_info.app_name)
         else:
             logger.warning("Permission check failed - could not get active window")
         
@@ -823,6 +873,32 @@ def get_screen_state_with_ai_fallback(
     return result
 
 
+# OpenAI client for the AI fallback, reused so its HTTP connection pool
+# (and the TLS session to the API) survives between screen checks
+_openai_client = None
+_openai_client_key: Optional[str] = None
+
+
+def _get_openai_client(api_key: str):
+    """
+    Return a shared OpenAI client, creating it on first use.
+
+    A new client is built only if the API key changes.
+
+    Args:
+        api_key: OpenAI API key.
+
+    Returns:
+        openai.OpenAI client instance.
+    """
+    global _openai_client, _openai_client_key
+    if _openai_client is None or _openai_client_key != api_key:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=api_key)
+        _openai_client_key = api_key
+    return _openai_client
+
+
 def _analyze_screen_with_ai() -> Optional[Dict[str, Any]]:
     """
     Analyse the current screen using OpenAI Vision API.
@@ -836,7 +912,6 @@ def _analyze_screen_with_ai() -> Optional[Dict[str, Any]]:
     """
     try:
         import config
-        from openai import OpenAI
         
         # Check if API key is available
         if not config.OPENAI_API_KEY:
@@ -849,7 +924,7 @@ def _analyze_screen_with_ai() -> Optional[Dict[str, Any]]:
             return None
         
         # Call OpenAI Vision API
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client = _get_openai_client(config.OPENAI_API_KEY)
         
         response = client.chat.completions.create(
             model=config.OPENAI_VISION_MODEL,
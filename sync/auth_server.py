@@ -18,10 +18,9 @@ Works identically on macOS and Windows.
 
 import json
 import logging
-import socket
 import threading
 import webbrowser
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from typing import Dict, Optional
 from urllib.parse import urlparse, parse_qs
 
@@ -31,18 +30,11 @@ logger = logging.getLogger(__name__)
 _AUTH_TIMEOUT = 300  # 5 minutes
 
 
-def _find_free_port() -> int:
-    """Find a free port on localhost."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
 # Module-level storage for the auth result (shared between handler and caller)
 _auth_result: Dict = {}
 _auth_received = threading.Event()
 
-# Success page shown in the browser after login
+# Success page shown in the browser after login (pre-encoded once at import)
 _SUCCESS_HTML = """<!DOCTYPE html>
 <html>
 <head>
@@ -70,12 +62,18 @@ _SUCCESS_HTML = """<!DOCTYPE html>
         <p>You can close this tab and return to BrainDock.</p>
     </div>
 </body>
-</html>"""
+</html>""".encode("utf-8")
+
+_MISSING_TOKENS_BODY = b"Missing auth tokens. Please try logging in again."
 
 
 class _AuthCallbackHandler(BaseHTTPRequestHandler):
     """HTTP request handler that captures auth callback tokens."""
 
+    # Headers and body go out as separate small writes; TCP_NODELAY stops
+    # Nagle holding the body back waiting for the browser's delayed ACK
+    disable_nagle_algorithm = True
+
     def do_GET(self) -> None:
         """Handle GET request from the website redirect."""
         global _auth_result
@@ -98,30 +96,35 @@ class _AuthCallbackHandler(BaseHTTPRequestHandler):
                 logger.info(f"Auth callback received for: {email or 'unknown'}")
 
                 # Send success response
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.end_headers()
-                self.wfile.write(_SUCCESS_HTML.encode("utf-8"))
+                self._send_body(200, "text/html; charset=utf-8", _SUCCESS_HTML)
             else:
                 _auth_result = {}
                 logger.warning("Auth callback missing tokens")
-                self.send_response(400)
-                self.send_header("Content-Type", "text/plain")
-                self.end_headers()
-                self.wfile.write(b"Missing auth tokens. Please try logging in again.")
+                self._send_body(400, "text/plain", _MISSING_TOKENS_BODY)
 
             # Signal that we received the callback
             _auth_received.set()
 
         elif parsed.path == "/health":
             # Health check endpoint
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain")
-            self.end_headers()
-            self.wfile.write(b"ok")
+            self._send_body(200, "text/plain", b"ok")
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_body(404, "text/plain", b"")
+
+    def _send_body(self, status: int, content_type: str, body: bytes) -> None:
+        """
+        Send a complete response with an explicit Content-Length.
+
+        Args:
+            status: HTTP status code.
+            content_type: Value for the Content-Type header.
+            body: Pre-encoded response body.
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, format, *args) -> None:
         """Suppress default HTTP log messages (use our logger instead)."""
@@ -147,18 +150,16 @@ def run_auth_callback_server(website_url: str = "https://thebraindock.com") -> O
     _auth_result = {}
     _auth_received.clear()
 
-    port = _find_free_port()
-    server = HTTPServer(("127.0.0.1", port), _AuthCallbackHandler)
-    server.timeout = 1  # Check for shutdown every second
+    # Bind straight to an ephemeral port: the socket the kernel picks is the
+    # one we serve on, so there is no probe-then-rebind race
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _AuthCallbackHandler)
+    port = server.server_address[1]
 
     logger.info(f"Auth callback server started on port {port}")
 
-    # Run server in background thread
-    def _serve() -> None:
-        while not _auth_received.is_set():
-            server.handle_request()
-
-    server_thread = threading.Thread(target=_serve, daemon=True)
+    # serve_forever() blocks in the selector between requests instead of
+    # re-entering handle_request() on a timeout, and is what shutdown() stops
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
     server_thread.start()
 
     # Open browser to the website login page
@@ -169,9 +170,10 @@ def run_auth_callback_server(website_url: str = "https://thebraindock.com") -> O
     # Wait for callback with timeout
     received = _auth_received.wait(timeout=_AUTH_TIMEOUT)
 
-    # Shutdown server
+    # Shutdown server and release the listening socket
     try:
         server.shutdown()
+        server.server_close()
     except Exception:
         pass
 
@@ -21,7 +21,7 @@ import logging
 import webbrowser
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import httpx
 import config
@@ -54,6 +54,11 @@ class BrainDockSync:
         self.auth_file: Path = self.data_dir / "auth.json"
         self.settings_cache_file: Path = self.data_dir / "settings_cache.json"
 
+        # (auth file mtime_ns, email) so get_stored_email() doesn't re-parse unchanged JSON.
+        # Cleared wherever this class writes or deletes auth.json, since two
+        # writes can share an mtime on coarse-grained filesystems
+        self._stored_email_cache: Optional[Tuple[int, str]] = None
+
         # Supabase client (lazy — only created when credentials exist)
         self._client = None
         self._init_client()
@@ -112,6 +117,7 @@ class BrainDockSync:
                 "expires_at": session.expires_at,
             }
             self.auth_file.write_text(json.dumps(data, indent=2))
+            self._stored_email_cache = None
             logger.info(f"Auth session saved for {session.user.email}")
         except Exception as e:
             logger.warning(f"Failed to save auth session: {e}")
@@ -158,16 +164,30 @@ class BrainDockSync:
         """
         Get email from locally stored auth file (no network call).
 
+        Polled by the menu bar for auth gating, so the parsed email is
+        cached and only re-read when the file's modification time changes.
+
         Returns:
             Stored email, or empty string.
         """
         try:
-            if self.auth_file.exists():
-                data = json.loads(self.auth_file.read_text())
-                return data.get("email", "")
+            mtime_ns = self.auth_file.stat().st_mtime_ns
+        except OSError:
+            # No auth file (logged out)
+            self._stored_email_cache = None
+            return ""
+
+        cached = self._stored_email_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            data = json.loads(self.auth_file.read_text())
+            email = data.get("email", "")
         except Exception:
-            pass
-        return ""
+            return ""
+        self._stored_email_cache = (mtime_ns, email)
+        return email
 
     def exchange_linking_code(self, code: str) -> Dict:
         """
@@ -215,6 +235,7 @@ class BrainDockSync:
                 "refresh_token": refresh_token,
                 "email": data.get("email", ""),
             }, indent=2))
+            self._stored_email_cache = None
             return {"success": True}
         except Exception as e:
             logger.error(f"Exchange linking code failed: {e}")
@@ -268,6 +289,7 @@ class BrainDockSync:
                         "refresh_token": result["refresh_token"],
                         "email": result.get("email", ""),
                     }, indent=2))
+                    self._stored_email_cache = None
                     return True
                 except Exception as e:
                     logger.error(f"Failed to save browser login tokens: {e}")
@@ -310,6 +332,7 @@ class BrainDockSync:
                 self.auth_file.unlink()
             except Exception:
                 pass
+        self._stored_email_cache = None
         logger.info("Logged out and cleared local tokens")
 
     # ------------------------------------------------------------------
@@ -354,8 +377,9 @@ class BrainDockSync:
         Fetch user's credit balance from user_credits (cloud source of truth).
 
         Returns:
-            {"total_purchased_seconds": int, "total_used_seconds": int, "remaining_seconds": int}
-            or empty/zero dict on error or no row.
+            {"total_purchased_seconds": int, "total_used_seconds": int, "remaining_seconds": int};
+            zeros when there is no client or no row, and an empty dict on a
+            fetch error so callers can keep their cached balance.
         """
         if not self._client:
             return {"total_purchased_seconds": 0, "total_used_seconds": 0, "remaining_seconds": 0}
@@ -377,7 +401,7 @@ class BrainDockSync:
             }
         except Exception as e:
             logger.warning(f"Failed to get credit balance: {e}")
-            return {"total_purchased_seconds": 0, "total_used_seconds": 0, "remaining_seconds": 0}
+            return {}
 
     def record_usage(self, seconds: int) -> bool:
         """
@@ -451,6 +451,88 @@ class TestTimestampGapFix(unittest.TestCase):
             self.assertLess(delta, 0.1)
 
 
+class TestUsageLimiterSync(unittest.TestCase):
+    """Test UsageLimiter session bookkeeping and cloud sync."""
+
+    def setUp(self):
+        """Point the usage cache at a temp dir so tests don't touch data/."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        data_file = Path(self._tmp.name) / "usage_data.json"
+        patcher = patch.object(config, "USAGE_DATA_FILE", data_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _make_limiter(self):
+        """Create a UsageLimiter backed by the temp data file."""
+        from tracking.usage_limiter import UsageLimiter
+        return UsageLimiter()
+
+    def test_end_session_uses_passed_timestamp(self):
+        """end_session should record the caller's stop time, not re-query the clock."""
+        limiter = self._make_limiter()
+        stop_time = datetime(2025, 1, 1, 12, 0, 0)
+
+        limiter.end_session(stop_time)
+
+        self.assertEqual(limiter.data["last_session_end"], stop_time.isoformat())
+
+    def test_sync_with_cloud_coalesces_recent_sync(self):
+        """A sync within max_age should reuse the previous result without a network call."""
+        limiter = self._make_limiter()
+        client = MagicMock()
+        client.get_credit_balance.return_value = {
+            "total_purchased_seconds": 3600,
+            "total_used_seconds": 60,
+        }
+        limiter.set_sync_client(client)
+
+        self.assertTrue(limiter.sync_with_cloud())
+        self.assertTrue(limiter.sync_with_cloud(max_age=60))
+        self.assertEqual(client.get_credit_balance.call_count, 1)
+
+        # max_age=0 always goes to the cloud
+        limiter.sync_with_cloud()
+        self.assertEqual(client.get_credit_balance.call_count, 2)
+
+    def test_sync_with_cloud_backs_off_and_keeps_cache_on_failure(self):
+        """A failed fetch should keep the cached balance and pause periodic retries."""
+        import tracking.usage_limiter as limiter_module
+
+        limiter = self._make_limiter()
+        limiter.data["total_granted_seconds"] = 7200
+        client = MagicMock()
+        client.get_credit_balance.return_value = {}
+        limiter.set_sync_client(client)
+        balance = {"total_purchased_seconds": 3600, "total_used_seconds": 60}
+        retry_after = config.CREDITS_REFRESH_INTERVAL
+
+        with patch.object(limiter_module, "time") as fake_time:
+            fake_time.monotonic.return_value = 1000.0
+            self.assertFalse(limiter.sync_with_cloud())
+            self.assertEqual(limiter.data["total_granted_seconds"], 7200)
+
+            # Periodic (max_age > 0) callers don't hit the cloud inside the backoff window
+            fake_time.monotonic.return_value = 1000.0 + retry_after - 1
+            self.assertFalse(limiter.sync_with_cloud(max_age=15))
+            self.assertEqual(client.get_credit_balance.call_count, 1)
+
+            # Once the window has passed, the periodic sync retries and succeeds
+            client.get_credit_balance.return_value = balance
+            fake_time.monotonic.return_value = 1000.0 + retry_after
+            self.assertTrue(limiter.sync_with_cloud(max_age=15))
+            self.assertEqual(client.get_credit_balance.call_count, 2)
+            self.assertEqual(limiter.data["total_granted_seconds"], 3600)
+
+            # Success resets the backoff: the next failure waits one interval, not two
+            client.get_credit_balance.return_value = {}
+            fake_time.monotonic.return_value = 2000.0
+            self.assertFalse(limiter.sync_with_cloud())
+            fake_time.monotonic.return_value = 2000.0 + retry_after
+            limiter.sync_with_cloud(max_age=15)
+            self.assertEqual(client.get_credit_balance.call_count, 4)
+
+
 class TestMalformedDateHandling(unittest.TestCase):
     """Test handling of malformed dates in analytics."""
     
@@ -636,6 +718,16 @@ class TestGadgetConfidenceTypeValidation(unittest.TestCase):
 class TestExceptionHandlingInSave(unittest.TestCase):
     """Test that save methods catch all relevant exceptions."""
     
+    def setUp(self):
+        """Point the trackers at a temp dir so failed saves don't leave files in data/."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        tmp_dir = Path(self._tmp.name)
+        for name, value in (("USER_DATA_DIR", tmp_dir), ("USAGE_DATA_FILE", tmp_dir / "usage_data.json")):
+            patcher = patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def test_daily_stats_save_catches_permission_error(self):
         """_save_data should catch PermissionError."""
         from tracking.daily_stats import DailyStatsTracker
@@ -699,5 +791,72 @@ class TestRetryLogicInVisionDetector(unittest.TestCase):
             )
 
 
+class TestAuthCallbackServer(unittest.TestCase):
+    """Test the local browser-login callback server."""
+
+    def test_callback_returns_tokens_and_server_stops(self):
+        """run_auth_callback_server should return tokens and shut down promptly."""
+        import urllib.request
+        from urllib.parse import urlparse, parse_qs
+        from sync import auth_server
+
+        def fake_browser_open(url):
+            port = parse_qs(urlparse(url).query)["port"][0]
+            callback = (
+                f"http://127.0.0.1:{port}/auth/callback"
+                "?access_token=a&refresh_token=r&email=user%40example.com"
+            )
+            threading.Thread(
+                target=lambda: urllib.request.urlopen(callback, timeout=5).read(),
+                daemon=True,
+            ).start()
+            return True
+
+        result = {}
+        with patch.object(auth_server.webbrowser, "open", side_effect=fake_browser_open):
+            worker = threading.Thread(
+                target=lambda: result.update(
+                    auth_server.run_auth_callback_server("http://localhost") or {}
+                ),
+                daemon=True,
+            )
+            worker.start()
+            worker.join(timeout=10)
+
+        self.assertFalse(worker.is_alive(), "auth server did not shut down")
+        self.assertEqual(result.get("access_token"), "a")
+        self.assertEqual(result.get("refresh_token"), "r")
+        self.assertEqual(result.get("email"), "user@example.com")
+
+
+
+class TestStoredEmailCache(unittest.TestCase):
+    """Test that the cached stored email follows logins and logouts."""
+
+    def test_relogin_as_other_account_with_same_mtime(self):
+        """A new login must not serve the old email even if auth.json keeps its mtime."""
+        from sync.supabase_client import BrainDockSync
+
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(config, "USER_DATA_DIR", Path(tmp)):
+            client = BrainDockSync(supabase_url="", supabase_key="")
+            client._client = None
+            client.auth_file.write_text(json.dumps({"email": "old@example.com"}))
+            os.utime(client.auth_file, ns=(1_000_000_000, 1_000_000_000))
+            self.assertEqual(client.get_stored_email(), "old@example.com")
+
+            client.logout()
+            tokens = {
+                "access_token": "a",
+                "refresh_token": "r",
+                "email": "new@example.com",
+            }
+            with patch("sync.auth_server.run_auth_callback_server", return_value=tokens):
+                self.assertTrue(client.login_with_browser("http://localhost"))
+            # Coarse filesystem timestamps can make both writes look identical
+            os.utime(client.auth_file, ns=(1_000_000_000, 1_000_000_000))
+
+            self.assertEqual(client.get_stored_email(), "new@example.com")
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ independently of any UI framework.
 
 import sys
 import time
+import threading
 import unittest
 import logging
 from pathlib import Path
@@ -85,7 +86,7 @@ class TestSessionEngineStartStop(unittest.TestCase):
         self.assertIsNone(result["report_path"])
 
     @patch("core.engine.create_vision_detector")
-    @patch("core.engine.CameraCapture")
+    @patch("camera.capture.CameraCapture")
     def test_start_stop_camera_mode(self, mock_camera_cls, mock_detector_cls):
         """
         Start and stop in camera mode (mocked camera/detector).
@@ -94,7 +95,7 @@ class TestSessionEngineStartStop(unittest.TestCase):
         # Mock camera to open successfully then return no frames
         mock_camera = MagicMock()
         mock_camera.is_opened = True
-        mock_camera.frame_iterator.return_value = iter([])
+        mock_camera.read_latest_frame.return_value = (False, None)
         mock_camera.__enter__ = MagicMock(return_value=mock_camera)
         mock_camera.__exit__ = MagicMock(return_value=False)
         mock_camera_cls.return_value = mock_camera
@@ -113,7 +114,7 @@ class TestSessionEngineStartStop(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertTrue(engine.is_running)
 
-        # Give detection thread time to start and finish (empty iterator)
+        # Give detection thread time to start and finish (no frames)
         time.sleep(0.5)
 
         result = engine.stop_session()
@@ -160,6 +161,27 @@ class TestSessionEnginePauseResume(unittest.TestCase):
         self.assertIsNone(engine.pause_start_time)
         self.assertGreaterEqual(engine.total_paused_seconds, 0)
 
+    def test_pause_time_uses_same_clock_as_elapsed(self):
+        """Paused time and elapsed time are both measured on the monotonic clock."""
+        engine = SessionEngine()
+        engine.is_running = True
+        engine.session_started = True
+        engine.session = MagicMock()
+        engine.session_start_time = __import__("datetime").datetime.now()
+
+        with patch("core.engine.time.monotonic") as mono:
+            engine._session_start_monotonic = 1000.0
+            mono.return_value = 1100.0
+            engine.pause_session()
+            # Wall clock may jump (e.g. laptop sleep); only monotonic time counts
+            mono.return_value = 1150.0
+            engine.resume_session()
+            mono.return_value = 1200.0
+            status = engine.get_status()
+
+        self.assertEqual(engine.total_paused_seconds, 50.0)
+        self.assertEqual(status["elapsed_seconds"], 150)
+
 
 class TestPriorityResolution(unittest.TestCase):
     """Test the _resolve_priority_status method."""
@@ -253,6 +275,73 @@ class TestCallbackPattern(unittest.TestCase):
         self.assertEqual(calls, [("focused", "Focussed")])
         self.assertEqual(engine.current_status, "focused")
 
+    def test_repeated_detection_status_notifies_once(self):
+        """Identical consecutive detection results only notify the UI once."""
+        engine = SessionEngine()
+        calls = []
+        engine.on_status_change = lambda s, t: calls.append((s, t))
+        engine._update_detection_status(config.EVENT_PRESENT)
+        engine._update_detection_status(config.EVENT_PRESENT)
+        engine._update_detection_status(config.EVENT_AWAY)
+        self.assertEqual(calls, [("focused", "Focussed"), ("away", "Away from Desk")])
+
+    def test_report_delivered_via_session_ended(self):
+        """The background report worker passes the report path to on_session_ended."""
+        engine = SessionEngine()
+        engine.session = MagicMock()
+        engine.session_started = True
+        ended = []
+        engine.on_session_ended = ended.append
+
+        with patch.object(engine, "_generate_report", return_value=Path("report.pdf")) as gen:
+            engine._start_report_worker()
+            engine._report_thread.join(timeout=5)
+
+        gen.assert_called_once_with(engine.session)
+        self.assertEqual(ended, [Path("report.pdf")])
+
+    def test_late_report_reports_old_session_while_new_one_runs(self):
+        """A report finishing after a new session started covers the old session."""
+        engine = SessionEngine()
+        old_session = MagicMock()
+        engine.session = old_session
+        engine.session_started = True
+        release = threading.Event()
+        ended = []
+        engine.on_session_ended = lambda path: ended.append((path, engine.is_running))
+
+        def slow_report(session):
+            release.wait(timeout=5)
+            return Path("old.pdf")
+
+        with patch.object(engine, "_generate_report", side_effect=slow_report) as gen:
+            engine._start_report_worker()
+            # A new session starts before the old report is done
+            engine.session = MagicMock()
+            engine.is_running = True
+            release.set()
+            engine._report_thread.join(timeout=5)
+
+        gen.assert_called_once_with(old_session)
+        # The callback sees the new session running, so UIs must not reset to idle
+        self.assertEqual(ended, [(Path("old.pdf"), True)])
+
+    def test_unstarted_session_report_ignores_new_running_session(self):
+        """A stopped session that never started produces no report, even if a new one is live."""
+        engine = SessionEngine()
+        ended = []
+        engine.on_session_ended = ended.append
+
+        # A new (e.g. screen-only) session is already running when the worker runs
+        engine.session = MagicMock()
+        engine.session_started = True
+
+        with patch.object(engine, "_generate_report") as gen:
+            engine._report_worker(None)
+
+        gen.assert_not_called()
+        self.assertEqual(ended, [None])
+
     def test_error_callback(self):
         """_notify_error calls the callback."""
         engine = SessionEngine()
@@ -12,6 +12,7 @@ import logging
 import os
 import tempfile
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -39,6 +40,9 @@ class UsageLimiter:
         self._tampered: bool = False  # Set True if integrity check fails
         self._lock = threading.Lock()  # Thread safety for data operations
         self._sync_client: Any = None  # BrainDockSync instance, set by engine
+        self._last_sync_monotonic: Optional[float] = None  # time.monotonic() of last good sync
+        self._sync_failures: int = 0  # Consecutive failed syncs (drives backoff)
+        self._sync_retry_at: Optional[float] = None  # time.monotonic() before which to skip retries
         self.data = self._load_data()
     
     def _compute_integrity_hash(self, data: dict) -> str:
@@ -235,18 +239,45 @@ class UsageLimiter:
         """Set the Supabase sync client for cloud credit fetch/record (called by engine)."""
         self._sync_client = client
 
-    def sync_with_cloud(self) -> bool:
+    def sync_with_cloud(self, max_age: float = 0.0) -> bool:
         """
         Fetch credit balance from cloud and update local cache.
 
+        Args:
+            max_age: If a successful sync happened within this many seconds,
+                     reuse it instead of making another network round-trip.
+                     Coalesces back-to-back syncs (e.g. settings apply
+                     immediately followed by session start). Callers passing
+                     max_age > 0 also respect the failure backoff, so an
+                     unreachable cloud isn't retried on every periodic tick.
+                     0 always syncs.
+
         Returns:
             True if cloud was reached and local data was updated, False if offline/error.
         """
         if not self._sync_client:
             logger.debug("No sync client — using local cache only")
             return False
+        if (
+            max_age > 0
+            and self._last_sync_monotonic is not None
+            and time.monotonic() - self._last_sync_monotonic < max_age
+        ):
+            logger.debug("Skipping credit sync — last sync is still fresh")
+            return True
+        if (
+            max_age > 0
+            and self._sync_retry_at is not None
+            and time.monotonic() < self._sync_retry_at
+        ):
+            logger.debug("Skipping credit sync — backing off after failure")
+            return False
         try:
             balance = self._sync_client.get_credit_balance()
+            if not balance:
+                # Empty result means the fetch failed; keep the local cache
+                self._record_sync_failure("credit balance unavailable")
+                return False
             purchased = int(balance.get("total_purchased_seconds", 0))
             cloud_used = int(balance.get("total_used_seconds", 0))
             with self._lock:
@@ -254,11 +285,32 @@ class UsageLimiter:
                 self.data["total_granted_seconds"] = purchased
                 self.data["total_used_seconds"] = cloud_used
                 self._save_data()
+            self._last_sync_monotonic = time.monotonic()
+            self._sync_failures = 0
+            self._sync_retry_at = None
             logger.debug(f"Synced credits from cloud: {purchased}s purchased, {cloud_used}s used")
             return True
         except Exception as e:
-            logger.warning(f"Could not sync credits from cloud: {e}")
+            self._record_sync_failure(e)
             return False
+
+    def _record_sync_failure(self, reason: Any) -> None:
+        """
+        Log a failed sync and push back the next opportunistic retry.
+
+        The delay doubles per consecutive failure, starting at the menu
+        refresh interval and capped at CREDITS_SYNC_INTERVAL.
+
+        Args:
+            reason: Exception or message describing the failure.
+        """
+        self._sync_failures += 1
+        delay = min(
+            config.CREDITS_SYNC_INTERVAL,
+            config.CREDITS_REFRESH_INTERVAL * 2 ** (self._sync_failures - 1),
+        )
+        self._sync_retry_at = time.monotonic() + delay
+        logger.warning(f"Could not sync credits from cloud: {reason} (retrying in {delay}s)")
     
     def get_remaining_seconds(self) -> int:
         """
@@ -366,10 +418,17 @@ class UsageLimiter:
             if not self._sync_client.record_usage(seconds):
                 logger.warning("Failed to record usage to cloud (will use local cache until next sync)")
     
-    def end_session(self) -> None:
-        """Record the end of a session (thread-safe)."""
+    def end_session(self, end_time: Optional[datetime] = None) -> None:
+        """
+        Record the end of a session (thread-safe).
+
+        Args:
+            end_time: Optional end timestamp. If None, uses current time.
+                      Pass the caller's stop time so every end-of-session
+                      record shares the same wall-clock sample.
+        """
         with self._lock:
-            self.data["last_session_end"] = datetime.now().isoformat()
+            self.data["last_session_end"] = (end_time or datetime.now()).isoformat()
             self._save_data()
     
     def format_time(self, seconds: int, full_precision: bool = False) -> str: